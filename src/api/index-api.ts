@@ -1,7 +1,8 @@
 import { Router, Request, Response } from 'express';
 import { FileWatchManager } from '../indexing/FileWatchManager.js';
 import { WatchConfigManager } from '../indexing/WatchConfigManager.js';
-import neo4j from 'neo4j-driver';
+import { getSharedDriver } from '../managers/index.js';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
 import { validateAndSanitizePath, translateHostToContainer, getHostWorkspaceRoot } from '../utils/path-utils.js';
 import { promises as fs } from 'fs';
 
@@ -27,21 +28,54 @@ const getWatchManager = (): FileWatchManager => {
   return manager;
 };
 
+// Connected /indexing-progress clients share one progress subscription and
+// one heartbeat timer: each update is serialized once and the same frame is
+// written to every client, instead of a callback, a JSON.stringify and a
+// timer per connection
+const progressClients = new Set<Response>();
+let unsubscribeProgress: (() => void) | null = null;
+let progressHeartbeat: NodeJS.Timeout | null = null;
+
+function broadcastProgressFrame(frame: string): void {
+  for (const client of progressClients) {
+    try {
+      client.write(frame);
+    } catch (error) {
+      console.error('Error sending SSE progress:', error);
+      removeProgressClient(client);
+    }
+  }
+}
+
+function addProgressClient(res: Response): void {
+  progressClients.add(res);
+  if (unsubscribeProgress) return;
+
+  // Runs inside the indexing loop's progress flush - keep it to one
+  // serialization and buffered writes (no per-event logging)
+  unsubscribeProgress = getWatchManager().onProgress((progress) => {
+    broadcastProgressFrame(`data: ${JSON.stringify(progress)}\n\n`);
+  });
+  // Heartbeat every 30 seconds keeps idle connections alive
+  progressHeartbeat = setInterval(() => broadcastProgressFrame(': heartbeat\n\n'), 30000);
+}
+
+function removeProgressClient(res: Response): void {
+  if (!progressClients.delete(res) || progressClients.size > 0) return;
+
+  unsubscribeProgress?.();
+  unsubscribeProgress = null;
+  if (progressHeartbeat) clearInterval(progressHeartbeat);
+  progressHeartbeat = null;
+}
+
 /**
  * GET /api/indexed-folders - List indexed folders
  * @example fetch('/api/indexed-folders').then(r => r.json());
  */
 router.get('/indexed-folders', async (req: Request, res: Response) => {
-  let driver: neo4j.Driver | null = null;
-  
   try {
-    driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const configManager = new WatchConfigManager(driver);
     const watchConfigs = await configManager.listAll();
@@ -49,7 +83,7 @@ router.get('/indexed-folders', async (req: Request, res: Response) => {
     // Use separate session for each query to avoid transaction conflicts
     const folders = await Promise.all(
       watchConfigs.map(async (config) => {
-        const session = driver!.session();
+        const session = driver.session();
         try {
           // SIMPLIFIED: Files are stored with filesystem path as-is
           // No more multi-format checks - just use config.path directly
@@ -111,10 +145,6 @@ router.get('/indexed-folders', async (req: Request, res: Response) => {
       error: 'Failed to fetch indexed folders', 
       details: error.message 
     });
-  } finally {
-    if (driver) {
-      await driver.close();
-    }
   }
 });
 
@@ -188,20 +218,13 @@ router.post('/index-folder', async (req: Request, res: Response) => {
     console.log(`   Recursive: ${recursive !== false}`);
     console.log(`   Generate embeddings: ${generate_embeddings !== false}`);
 
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const configManager = new WatchConfigManager(driver);
     
     // Check if already watching (use container path)
     const existing = await configManager.getByPath(containerPath);
     if (existing) {
-      await driver.close();
       return res.status(409).json({ 
         error: 'Folder is already being watched', 
         path: resolvedPath,
@@ -221,7 +244,6 @@ router.post('/index-folder', async (req: Request, res: Response) => {
       debounce_ms: 500
     });
 
-    await driver.close();
 
     // Start watching in background (don't await - let it run async)
     const watchManager = getWatchManager();
@@ -264,20 +286,13 @@ router.delete('/indexed-folders', async (req: Request, res: Response) => {
 
     console.log(`🗑️ Removing watch config by ID: ${id}`);
 
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const configManager = new WatchConfigManager(driver);
     
     // Get config by ID
     const config = await configManager.getById(id);
     if (!config) {
-      await driver.close();
       return res.status(404).json({ 
         error: 'Watch configuration not found', 
         id
@@ -333,6 +348,7 @@ router.delete('/indexed-folders', async (req: Request, res: Response) => {
       
       filesDeleted += pathFilesDeleted;
       chunksDeleted += pathChunksDeleted;
+      invalidateSearchCache();
       
       if (pathFilesDeleted > 0) {
         console.log(`🧹 Cleaned up ${pathFilesDeleted} orphaned files (no relationships) via path matching`);
@@ -353,7 +369,6 @@ router.delete('/indexed-folders', async (req: Request, res: Response) => {
       });
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error removing folder from indexing:', error);
@@ -369,8 +384,6 @@ router.delete('/indexed-folders', async (req: Request, res: Response) => {
  * Reactivates an inactive watch configuration
  */
 router.patch('/indexed-folders/reactivate', async (req: Request, res: Response) => {
-  let driver: neo4j.Driver | null = null;
-  
   try {
     const { id } = req.body;
 
@@ -380,13 +393,7 @@ router.patch('/indexed-folders/reactivate', async (req: Request, res: Response)
 
     console.log(`🔄 Reactivating watch config by ID: ${id}`);
 
-    driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const configManager = new WatchConfigManager(driver);
     
@@ -461,10 +468,6 @@ router.patch('/indexed-folders/reactivate', async (req: Request, res: Response)
       error: 'Failed to reactivate watch', 
       details: error.message 
     });
-  } finally {
-    if (driver) {
-      await driver.close();
-    }
   }
 });
 
@@ -497,13 +500,7 @@ router.get('/indexing-status', async (req: Request, res: Response) => {
     const statuses: { path: string; isIndexing: boolean }[] = [];
     
     // Get all watched folders and check their indexing status
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
     
     const configManager = new WatchConfigManager(driver);
     const watchConfigs = await configManager.listAll();
@@ -515,7 +512,6 @@ router.get('/indexing-status', async (req: Request, res: Response) => {
       });
     }
     
-    await driver.close();
     
     res.json({ statuses });
   } catch (error: any) {
@@ -562,35 +558,15 @@ router.get('/indexing-progress', (req: Request, res: Response) => {
   const allProgress = watchManager.getAllProgress();
   console.log(`[SSE] New client connected. Sending ${allProgress.length} initial progress updates`);
   for (const progress of allProgress) {
-    const data = JSON.stringify(progress);
-    console.log(`[SSE] Initial progress for path: ${progress.path} (${progress.indexed}/${progress.totalFiles}) status: ${progress.status}`);
-    res.write(`data: ${data}\n\n`);
+    res.write(`data: ${JSON.stringify(progress)}\n\n`);
   }
 
-  // Register callback for real-time progress updates (per-file)
-  const unsubscribe = watchManager.onProgress((progress) => {
-    try {
-      const data = JSON.stringify(progress);
-      console.log(`[SSE] Sending progress for path: ${progress.path} (${progress.indexed}/${progress.totalFiles})`);
-      res.write(`data: ${data}\n\n`);
-    } catch (error) {
-      console.error('Error sending SSE progress:', error);
-    }
-  });
-
-  // Send heartbeat every 30 seconds to keep connection alive
-  const heartbeatId = setInterval(() => {
-    try {
-      res.write(`: heartbeat\n\n`);
-    } catch (error) {
-      clearInterval(heartbeatId);
-    }
-  }, 30000);
+  // Real-time progress updates (per-file) and heartbeats
+  addProgressClient(res);
 
   // Clean up on client disconnect
   req.on('close', () => {
-    unsubscribe();
-    clearInterval(heartbeatId);
+    removeProgressClient(res);
     console.log('📡 SSE client disconnected from indexing progress');
   });
 
@@ -603,34 +579,27 @@ router.get('/indexing-progress', (req: Request, res: Response) => {
  */
 router.get('/index-stats', async (req: Request, res: Response) => {
   try {
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
 
     try {
-      // Get aggregate stats
+      // Aggregate stats and the per-extension breakdown in one pass over File
+      // nodes: totals are summed from the per-extension rows instead of
+      // scanning the files a second time. Chunk counts come from per-file
+      // subqueries, so a file's own embedding is counted once rather than
+      // once per chunk row.
       const statsResult = await session.run(`
         MATCH (f:File)
-        OPTIONAL MATCH (f)-[:HAS_CHUNK]->(c:FileChunk)
-        WITH f, c,
-          CASE WHEN c IS NOT NULL AND c.embedding IS NOT NULL THEN 1 ELSE 0 END as chunkHasEmbedding,
-          CASE WHEN f.embedding IS NOT NULL THEN 1 ELSE 0 END as fileHasEmbedding
-        WITH 
-          COUNT(DISTINCT f) as totalFiles,
-          COUNT(DISTINCT c) as totalChunks,
-          SUM(chunkHasEmbedding) + SUM(fileHasEmbedding) as totalEmbeddings,
-          COLLECT(DISTINCT f.extension) as extensions
-        RETURN 
-          totalFiles,
-          totalChunks,
-          totalEmbeddings,
-          extensions
+        WITH f.extension as ext,
+          COUNT(f) as files,
+          SUM(COUNT { (f)-[:HAS_CHUNK]->(:FileChunk) }) as chunks,
+          SUM(COUNT { (f)-[:HAS_CHUNK]->(c:FileChunk) WHERE c.embedding IS NOT NULL }) + COUNT(f.embedding) as embeddings
+        RETURN
+          SUM(files) as totalFiles,
+          SUM(chunks) as totalChunks,
+          SUM(embeddings) as totalEmbeddings,
+          COLLECT(CASE WHEN ext IS NOT NULL THEN { ext: ext, count: files } END) as extensions
       `);
 
       const statsRecord = statsResult.records[0];
@@ -638,21 +607,15 @@ router.get('/index-stats', async (req: Request, res: Response) => {
       const totalChunks = statsRecord ? toInt(statsRecord.get('totalChunks')) : 0;
       const totalEmbeddings = statsRecord ? toInt(statsRecord.get('totalEmbeddings')) : 0;
 
-      // Get file count by extension
-      const extensionResult = await session.run(`
-        MATCH (f:File)
-        WHERE f.extension IS NOT NULL
-        WITH f.extension as ext, COUNT(f) as count
-        RETURN ext, count
-        ORDER BY count DESC
-      `);
-
+      // File count by extension, largest first
+      const extensionCounts: Array<{ ext: string; count: any }> = statsRecord ? statsRecord.get('extensions') : [];
       const byExtension: Record<string, number> = {};
-      extensionResult.records.forEach(record => {
-        const ext = record.get('ext');
-        const count = toInt(record.get('count'));
-        byExtension[ext || '(no extension)'] = count;
-      });
+      extensionCounts
+        .map(({ ext, count }) => ({ ext, count: toInt(count) }))
+        .sort((a, b) => b.count - a.count)
+        .forEach(({ ext, count }) => {
+          byExtension[ext || '(no extension)'] = count;
+        });
 
       // Get file count by type (node label)
       const typeResult = await session.run(`
@@ -685,7 +648,6 @@ router.get('/index-stats', async (req: Request, res: Response) => {
       });
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error fetching index stats:', error);
@@ -702,13 +664,7 @@ router.get('/index-stats', async (req: Request, res: Response) => {
  */
 router.post('/migrate-indexed-folders', async (req: Request, res: Response) => {
   try {
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
     const configManager = new WatchConfigManager(driver);
@@ -793,7 +749,6 @@ router.post('/migrate-indexed-folders', async (req: Request, res: Response) => {
       });
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error migrating indexed folders:', error);
@@ -810,13 +765,7 @@ router.post('/migrate-indexed-folders', async (req: Request, res: Response) => {
  */
 router.post('/api/migrate-file-paths', async (req: Request, res: Response) => {
   try {
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
     const workspaceRoot = process.env.WORKSPACE_ROOT || '';
@@ -884,7 +833,6 @@ router.post('/api/migrate-file-paths', async (req: Request, res: Response) => {
       console.log(`✅ Migrated ${migrated} file paths`);
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error migrating file paths:', error);
@@ -901,13 +849,7 @@ router.post('/api/migrate-file-paths', async (req: Request, res: Response) => {
  */
 router.get('/debug-file-paths', async (req: Request, res: Response) => {
   try {
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
 
@@ -938,7 +880,6 @@ router.get('/debug-file-paths', async (req: Request, res: Response) => {
       });
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error fetching debug paths:', error);
@@ -955,13 +896,7 @@ router.get('/debug-file-paths', async (req: Request, res: Response) => {
  */
 router.post('/cleanup-invalid-watchconfigs', async (req: Request, res: Response) => {
   try {
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
 
@@ -990,6 +925,7 @@ router.post('/cleanup-invalid-watchconfigs', async (req: Request, res: Response)
         DETACH DELETE f, c, e
         RETURN count(DISTINCT f) as fileCount, count(DISTINCT c) as chunkCount, count(DISTINCT e) as embeddingCount
       `);
+      invalidateSearchCache();
 
       const fileStats = fileResult.records[0];
       const deletedFiles = fileStats ? toInt(fileStats.get('fileCount')) : 0;
@@ -1016,7 +952,6 @@ router.post('/cleanup-invalid-watchconfigs', async (req: Request, res: Response)
       console.log(`   - Deleted ${deletedEmbeddings} orphaned embeddings`);
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error cleaning up invalid data:', error);
@@ -1035,13 +970,7 @@ router.post('/migrate-watchconfig-paths', async (req: Request, res: Response) =>
   try {
     console.log('🔄 Migrating WatchConfig nodes to include host_path...');
     
-    const driver = neo4j.driver(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      neo4j.auth.basic(
-        process.env.NEO4J_USER || 'neo4j',
-        process.env.NEO4J_PASSWORD || 'your_password_here'
-      )
-    );
+    const driver = await getSharedDriver();
 
     const session = driver.session();
 
@@ -1101,7 +1030,6 @@ router.post('/migrate-watchconfig-paths', async (req: Request, res: Response) =>
       console.log(`✅ Migration complete: Updated ${updates.length} WatchConfig nodes`);
     } finally {
       await session.close();
-      await driver.close();
     }
   } catch (error: any) {
     console.error('❌ Error migrating WatchConfig paths:', error);
@@ -32,6 +32,7 @@
 
 import { Router } from 'express';
 import type { IGraphManager } from '../types/index.js';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
 import { handleIndexFolder, handleRemoveFolder, handleListWatchedFolders } from '../tools/fileIndexing.tools.js';
 
 export function createMCPToolsRouter(graphManager: IGraphManager): Router {
@@ -234,6 +235,7 @@ export function createMCPToolsRouter(graphManager: IGraphManager): Router {
         );
 
         const memoryId = result.records[0]?.get('memoryId');
+        invalidateSearchCache();
 
         console.log(`✅ Conversation saved as memory: ${memoryId}`);
 
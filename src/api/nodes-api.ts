@@ -29,12 +29,29 @@
 
 import { Router, Request, Response, NextFunction } from 'express';
 import neo4j from 'neo4j-driver';
+import { getSharedDriver, getSharedGraphManager } from '../managers/index.js';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
+import { handleVectorSearchNodes } from '../tools/vectorSearch.tools.js';
+import { EmbeddingsService } from '../indexing/EmbeddingsService.js';
+import { debugLog } from '../utils/logger.js';
+import { hasText } from '../utils/text.js';
 
 // No auth in mimir-lite - noop middleware
 const noAuth = (_req: Request, _res: Response, next: NextFunction) => next();
 
 const router = Router();
 
+// Embeddings service for POST /:id/embeddings - config is read (and the
+// provider banner logged) once per process, not once per request
+let embeddingsServiceReady: Promise<EmbeddingsService> | null = null;
+function getEmbeddingsService(): Promise<EmbeddingsService> {
+  return embeddingsServiceReady ??= (async () => {
+    const service = new EmbeddingsService();
+    await service.initialize();
+    return service;
+  })();
+}
+
 /**
  * Safely convert Neo4j integers to JavaScript numbers.
  */
@@ -57,13 +74,7 @@ const toInt = (value: any): number => {
  *   .then(data => console.log(data.types));
  */
 router.get('/types', noAuth, async (req: Request, res: Response) => {
-  const driver = neo4j.driver(
-    process.env.NEO4J_URI || 'bolt://localhost:7687',
-    neo4j.auth.basic(
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    )
-  );
+  const driver = await getSharedDriver();
 
   const session = driver.session();
 
@@ -96,7 +107,6 @@ router.get('/types', noAuth, async (req: Request, res: Response) => {
     });
   } finally {
     await session.close();
-    await driver.close();
   }
 });
 
@@ -136,15 +146,7 @@ router.get('/vector-search', noAuth, async (req: Request, res: Response) => {
       types = typesParam.split(',').map(t => t.trim());
     }
 
-    // Import GraphManager and handleVectorSearchNodes
-    const { GraphManager } = await import('../managers/GraphManager.js');
-    const { handleVectorSearchNodes } = await import('../tools/vectorSearch.tools.js');
-    
-    const graphManager = new GraphManager(
-      process.env.NEO4J_URI || 'bolt://localhost:7687',
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    );
+    const driver = await getSharedDriver();
 
     // Use the same tool handler as chat API for consistency
     const results = await handleVectorSearchNodes(
@@ -159,7 +161,7 @@ router.get('/vector-search', noAuth, async (req: Request, res: Response) => {
         rrf_bm25_weight: rrfBm25Weight,
         rrf_min_score: rrfMinScore
       },
-      graphManager.getDriver()
+      driver
     );
 
     // Handle both UnifiedSearchResponse format and tool response format
@@ -217,13 +219,7 @@ router.get('/types/:type', noAuth, async (req: Request, res: Response) => {
   const limit = Math.floor(parseInt(req.query.limit as string, 10)) || 20;
   const skip = (page - 1) * limit;
 
-  const driver = neo4j.driver(
-    process.env.NEO4J_URI || 'bolt://localhost:7687',
-    neo4j.auth.basic(
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    )
-  );
+  const driver = await getSharedDriver();
 
   const session = driver.session();
 
@@ -264,7 +260,9 @@ router.get('/types/:type', noAuth, async (req: Request, res: Response) => {
         n.updated as updated,
         edgeCount,
         embeddingCount,
-        properties(n) as properties
+        // Drop the embedding vector: ~1K floats per node over Bolt and again in
+        // the JSON response, and the list view never reads it
+        n { .*, embedding: null } as properties
       ORDER BY n.updated DESC, n.created DESC
       SKIP $skip
       LIMIT $limit
@@ -300,7 +298,6 @@ router.get('/types/:type', noAuth, async (req: Request, res: Response) => {
     });
   } finally {
     await session.close();
-    await driver.close();
   }
 });
 
@@ -341,13 +338,7 @@ router.get('/types/:type', noAuth, async (req: Request, res: Response) => {
 router.get('/types/:type/:id/details', noAuth, async (req: Request, res: Response) => {
   const { type, id } = req.params;
 
-  const driver = neo4j.driver(
-    process.env.NEO4J_URI || 'bolt://localhost:7687',
-    neo4j.auth.basic(
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    )
-  );
+  const driver = await getSharedDriver();
 
   const session = driver.session();
 
@@ -363,7 +354,6 @@ router.get('/types/:type/:id/details', noAuth, async (req: Request, res: Respons
 
     if (nodeResult.records.length === 0) {
       await session.close();
-      await driver.close();
       return res.status(404).json({ error: 'Node not found' });
     }
 
@@ -435,7 +425,6 @@ router.get('/types/:type/:id/details', noAuth, async (req: Request, res: Respons
     });
   } finally {
     await session.close();
-    await driver.close();
   }
 });
 
@@ -451,13 +440,7 @@ router.get('/types/:type/:id/details', noAuth, async (req: Request, res: Respons
 router.delete('/:id', noAuth, async (req: Request, res: Response) => {
   const { id } = req.params;
 
-  const driver = neo4j.driver(
-    process.env.NEO4J_URI || 'bolt://localhost:7687',
-    neo4j.auth.basic(
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    )
-  );
+  const driver = await getSharedDriver();
 
   const session = driver.session();
 
@@ -473,7 +456,6 @@ router.delete('/:id', noAuth, async (req: Request, res: Response) => {
 
     if (nodeResult.records.length === 0) {
       await session.close();
-      await driver.close();
       return res.status(404).json({ error: 'Node not found' });
     }
 
@@ -491,6 +473,7 @@ router.delete('/:id', noAuth, async (req: Request, res: Response) => {
       `,
       { id }
     );
+    invalidateSearchCache();
 
     const edgeCount = toInt(deleteResult.records[0].get('edgeCount'));
 
@@ -514,7 +497,6 @@ router.delete('/:id', noAuth, async (req: Request, res: Response) => {
     });
   } finally {
     await session.close();
-    await driver.close();
   }
 });
 
@@ -580,25 +562,14 @@ router.delete('/:id', noAuth, async (req: Request, res: Response) => {
 router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
   const { id } = req.params;
 
-  const driver = neo4j.driver(
-    process.env.NEO4J_URI || 'bolt://localhost:7687',
-    neo4j.auth.basic(
-      process.env.NEO4J_USER || 'neo4j',
-      process.env.NEO4J_PASSWORD || 'password'
-    )
-  );
+  const driver = await getSharedDriver();
 
   const session = driver.session();
 
   try {
-    // Import EmbeddingsService
-    const { EmbeddingsService } = await import('../indexing/EmbeddingsService.js');
-    const embeddingsService = new EmbeddingsService();
-    
-    await embeddingsService.initialize();
+    const embeddingsService = await getEmbeddingsService();
     
     if (!embeddingsService.isEnabled()) {
-      await driver.close();
       return res.status(503).json({ 
         error: 'Embeddings service is not enabled',
         details: 'Check your LLM configuration'
@@ -612,19 +583,17 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
     );
 
     if (nodeResult.records.length === 0) {
-      await driver.close();
       return res.status(404).json({ error: 'Node not found' });
     }
 
     const node = nodeResult.records[0].get('n').properties;
 
-    console.log(`🔄 Generating embeddings for node ${id} (${node.type})...`);
+    debugLog(`🔄 Generating embeddings for node ${id} (${node.type})...`);
 
     // Extract text content for embedding
     const textContent = node.content || node.text || node.title || node.description || '';
     
-    if (!textContent || textContent.trim().length === 0) {
-      await driver.close();
+    if (!hasText(textContent)) {
       return res.status(400).json({ 
         error: 'No text content found',
         details: 'Node must have content, text, title, or description property'
@@ -636,7 +605,7 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
     // Check if content needs chunking
     if (textContent.length > chunkSize) {
       // Large content - use chunking
-      console.log(`📦 Node ${id} has large content (${textContent.length} chars), creating chunks...`);
+      debugLog(`📦 Node ${id} has large content (${textContent.length} chars), creating chunks...`);
       
       const chunks = await embeddingsService.generateChunkEmbeddings(textContent);
       
@@ -661,7 +630,6 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
             text: $text,
             start_offset: $startOffset,
             end_offset: $endOffset,
-            embedding: $embedding,
             embedding_dimensions: $dimensions,
             embedding_model: $model,
             type: 'node_chunk',
@@ -670,6 +638,8 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
             has_embedding: true
           })
           CREATE (n)-[:HAS_CHUNK {index: $chunkIndex}]->(c)
+          WITH c
+          CALL db.create.setNodeVectorProperty(c, 'embedding', $embedding)
           `,
           {
             nodeId: id,
@@ -695,7 +665,7 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
         { id, model: chunks[0].model }
       );
       
-      console.log(`✅ Generated ${chunks.length} chunk embeddings for node ${id}`);
+      debugLog(`✅ Generated ${chunks.length} chunk embeddings for node ${id}`);
       
       res.json({
         success: true,
@@ -709,8 +679,8 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
       
       await session.run(
         `MATCH (n) WHERE n.id = $id
-         SET n.embedding = $embedding,
-             n.embedding_dimensions = $dimensions,
+         CALL db.create.setNodeVectorProperty(n, 'embedding', $embedding)
+         SET n.embedding_dimensions = $dimensions,
              n.embedding_model = $model,
              n.has_embedding = true,
              n.has_chunks = false
@@ -725,7 +695,7 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
         }
       );
       
-      console.log(`✅ Generated single embedding for node ${id} (${result.dimensions} dimensions)`);
+      debugLog(`✅ Generated single embedding for node ${id} (${result.dimensions} dimensions)`);
       
       res.json({
         success: true,
@@ -743,8 +713,9 @@ router.post('/:id/embeddings', noAuth, async (req: Request, res: Response) => {
       details: error.message
     });
   } finally {
+    // Chunks or the node's embedding may have been rewritten
+    invalidateSearchCache();
     await session.close();
-    await driver.close();
   }
 });
 
@@ -774,12 +745,10 @@ router.post('/', noAuth, async (req: Request, res: Response) => {
   }
 
   try {
-    const { createGraphManager } = await import('../managers/index.js');
-    const graphManager = await createGraphManager();
+    const graphManager = await getSharedGraphManager();
 
     const node = await graphManager.addNode(type, properties || {});
 
-    await graphManager.close();
 
     res.status(201).json({
       success: true,
@@ -845,12 +814,10 @@ router.put('/:id', noAuth, async (req: Request, res: Response) => {
   }
 
   try {
-    const { createGraphManager } = await import('../managers/index.js');
-    const graphManager = await createGraphManager();
+    const graphManager = await getSharedGraphManager();
 
     const node = await graphManager.updateNode(id, properties);
 
-    await graphManager.close();
 
     res.json({
       success: true,
@@ -930,12 +897,10 @@ router.patch('/:id', noAuth, async (req: Request, res: Response) => {
   }
 
   try {
-    const { createGraphManager } = await import('../managers/index.js');
-    const graphManager = await createGraphManager();
+    const graphManager = await getSharedGraphManager();
 
     const node = await graphManager.updateNode(id, properties);
 
-    await graphManager.close();
 
     res.json({
       success: true,
@@ -970,12 +935,10 @@ router.get('/:id', noAuth, async (req: Request, res: Response) => {
   const { id } = req.params;
 
   try {
-    const { createGraphManager } = await import('../managers/index.js');
-    const graphManager = await createGraphManager();
+    const graphManager = await getSharedGraphManager();
 
     const node = await graphManager.getNode(id);
 
-    await graphManager.close();
 
     if (!node) {
       return res.status(404).json({
@@ -35,13 +35,14 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import { AsyncLocalStorage } from 'async_hooks';
 import { StreamableHTTPServerTransport } from '@modelcontextprotocol/sdk/server/streamableHttp.js';
-import { server, initializeGraphManager, allTools } from './index.js';
+import { server, initializeGraphManager, allTools, fileWatchManager as indexWatchManager } from './index.js';
 import { createMCPToolsRouter } from './api/mcp-tools-api.js';
 import indexRouter from './api/index-api.js';
 import nodesRouter from './api/nodes-api.js';
 import { FileWatchManager } from './indexing/FileWatchManager.js';
 import type { IGraphManager } from './types/index.js';
 import { parsePathMappingsFromString } from './utils/path-utils.js';
+import { closeSharedGraphManager } from './managers/index.js';
 
 // AsyncLocalStorage for per-request context (e.g., path mapping from headers)
 export interface RequestContext {
@@ -49,13 +50,22 @@ export interface RequestContext {
 }
 export const requestContext = new AsyncLocalStorage<RequestContext>();
 
+// Last parsed X-Mimir-Path-Map header - a client sends the same value on every request
+let pathMapCache: { header: string; mappings: Array<[string, string]> } | null = null;
+
 /**
  * Get path mappings from current request context (header) or env
+ *
+ * The header is only parsed (JSON array or key=value list) when it differs
+ * from the previous request's; repeats return the cached mappings.
  */
 export function getRequestPathMappings(): Array<[string, string]> | undefined {
   const ctx = requestContext.getStore();
   if (ctx?.pathMapHeader) {
-    return parsePathMappingsFromString(ctx.pathMapHeader);
+    if (pathMapCache?.header !== ctx.pathMapHeader) {
+      pathMapCache = { header: ctx.pathMapHeader, mappings: parsePathMappingsFromString(ctx.pathMapHeader) };
+    }
+    return pathMapCache.mappings;
   }
   return undefined;
 }
@@ -83,7 +93,6 @@ async function startHttpServer() {
     console.log(`   Types: ${JSON.stringify(stats.types)}`);
 
     // Get FileWatchManager instance
-    const { fileWatchManager: indexWatchManager } = await import('./index.js');
     (globalThis as any).fileWatchManager = indexWatchManager;
     console.log(`✅ FileWatchManager initialized`);
   } catch (error: any) {
@@ -219,7 +228,10 @@ async function startHttpServer() {
   // Graceful shutdown
   const shutdown = (signal: string) => {
     console.log(`\n${signal} - shutting down...`);
-    httpServer.close(() => process.exit(0));
+    httpServer.close(async () => {
+      await closeSharedGraphManager();
+      process.exit(0);
+    });
     setTimeout(() => process.exit(1), 10000);
   };
 
@@ -40,7 +40,7 @@ import {
   ListToolsRequestSchema,
 } from "@modelcontextprotocol/sdk/types.js";
 
-import { createGraphManager, type IGraphManager } from "./managers/index.js";
+import { getSharedGraphManager, type IGraphManager } from "./managers/index.js";
 import { 
   GRAPH_TOOLS,
   handleMemoryNode,
@@ -49,12 +49,12 @@ import {
   handleMemoryLock,
   handleMemoryClear
 } from "./tools/index.js";
-import type { NodeType, EdgeType, ClearType } from "./types/index.js";
 
 // File Indexing
 import { FileWatchManager } from "./indexing/FileWatchManager.js";
 import { WatchConfigManager } from "./indexing/WatchConfigManager.js";
 import { translateHostToContainer } from "./utils/path-utils.js";
+import { promises as fs } from "fs";
 import {
   createFileIndexingTools,
   handleIndexFolder,
@@ -105,6 +105,26 @@ export const server = new Server(
 // Tool Handlers
 // ============================================================================
 
+// Indentation for tool results; compact unless MIMIR_MCP_PRETTY_JSON=true
+const getResultIndent = () => process.env.MIMIR_MCP_PRETTY_JSON === 'true' ? 2 : undefined;
+
+/**
+ * Wrap a tool result as MCP text content, serialized once
+ *
+ * Results are read by the calling model, not a person. Indenting a search
+ * result or batch response of full node content adds two spaces per nesting
+ * level to every line, which makes stringify slower and the payload (and the
+ * client's token count) larger for no gain.
+ *
+ * @example
+ * return textResult(await handleTodo(args, graphManager));
+ */
+function textResult(result: unknown) {
+  return {
+    content: [{ type: "text", text: JSON.stringify(result, null, getResultIndent()) }]
+  };
+}
+
 server.setRequestHandler(ListToolsRequestSchema, async () => {
   console.error(`[MCP] tools/list called, returning ${allTools.length} tools`);
   return { tools: allTools };
@@ -121,37 +141,27 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
       case "memory_node": {
         const result = await handleMemoryNode(args, graphManager);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       case "memory_edge": {
         const result = await handleMemoryEdge(args, graphManager);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       case "memory_batch": {
         const result = await handleMemoryBatch(args, graphManager);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       case "memory_lock": {
         const result = await handleMemoryLock(args, graphManager);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       case "memory_clear": {
         const result = await handleMemoryClear(args, graphManager);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       // ========================================================================
@@ -160,38 +170,17 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
       case "index_folder": {
         const result = await handleIndexFolder(args, graphManager.getDriver(), fileWatchManager);
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       case "remove_folder": {
         const result = await handleRemoveFolder(args, graphManager.getDriver(), fileWatchManager);
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       case "list_folders": {
         const result = await handleListWatchedFolders(graphManager.getDriver());
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       // ========================================================================
@@ -200,21 +189,12 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
       case "vector_search_nodes": {
         const result = await handleVectorSearchNodes(args, graphManager.getDriver());
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }]
-        };
+        return textResult(result);
       }
 
       case "get_embedding_stats": {
         const result = await handleGetEmbeddingStats(args, graphManager.getDriver());
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       // ========================================================================
@@ -223,26 +203,12 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
       case "todo": {
         const result = await handleTodo(args, graphManager);
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       case "todo_list": {
         const result = await handleTodoList(args, graphManager);
-        return {
-          content: [
-            {
-              type: "text",
-              text: JSON.stringify(result, null, 2)
-            }
-          ]
-        };
+        return textResult(result);
       }
 
       default:
@@ -275,7 +241,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
 export async function initializeGraphManager() {
   if (!graphManager) {
-    graphManager = await createGraphManager();
+    graphManager = await getSharedGraphManager();
     
     // Initialize file watch manager
     fileWatchManager = new FileWatchManager(graphManager.getDriver());
@@ -318,9 +284,7 @@ async function restoreFileWatchers() {
       // Translate host path to container path for existence check
       const containerPath = translateHostToContainer(config.path);
 
-      const pathExists = await import('fs').then(fs =>
-        fs.promises.access(containerPath).then(() => true).catch(() => false)
-      );
+      const pathExists = await fs.access(containerPath).then(() => true).catch(() => false);
 
       if (pathExists) {
         await fileWatchManager.startWatch(config);
@@ -361,8 +325,6 @@ async function ensureDocsIndexed(configManager: WatchConfigManager) {
     return;
   }
   
-  const fs = await import('fs').then(m => m.promises);
-  
   // Documentation is always at /app/docs in container
   const docsPath = '/app/docs';
   console.error(`📖 Checking if ${docsPath} exists...`);
@@ -406,8 +368,6 @@ async function ensureDocsIndexed(configManager: WatchConfigManager) {
   console.error('📖 Auto-indexing documentation folder for first-time users...');
   
   try {
-    const { handleIndexFolder } = await import('./tools/fileIndexing.tools.js');
-    
     const result = await handleIndexFolder(
       {
         path: docsPath,
@@ -7,6 +7,7 @@
  */
 
 import * as mammoth from 'mammoth';
+import { hasText } from '../utils/text.js';
 
 // Check if PDF parsing is disabled (for old CPUs without AVX instructions)
 const PDF_DISABLED = process.env.MIMIR_DISABLE_PDF === 'true';
@@ -15,6 +16,13 @@ if (PDF_DISABLED) {
   console.log('⚠️  PDF parsing disabled (MIMIR_DISABLE_PDF=true)');
 }
 
+// pdf-parse stays a dynamic import so MIMIR_DISABLE_PDF hosts never load it,
+// but it is resolved once - not re-imported for every PDF in a folder
+let pdfParseModule: Promise<typeof import('pdf-parse')> | null = null;
+function loadPdfParse(): Promise<typeof import('pdf-parse')> {
+  return pdfParseModule ??= import('pdf-parse');
+}
+
 export class DocumentParser {
   /**
    * Extract plain text from PDF or DOCX files for indexing
@@ -99,12 +107,12 @@ export class DocumentParser {
     }
 
     // pdf-parse exports PDFParse as a named export
-    const { PDFParse } = await import('pdf-parse');
+    const { PDFParse } = await loadPdfParse();
     const parser = new PDFParse({ data: buffer });
     const textResult = await parser.getText();
 
     // getText() returns TextResult object with text property
-    if (!textResult.text || textResult.text.trim().length === 0) {
+    if (!hasText(textResult.text)) {
       throw new Error('PDF contains no extractable text content');
     }
 
@@ -120,7 +128,7 @@ export class DocumentParser {
     const result = await mammoth.extractRawText({ buffer });
     
     // mammoth returns { value: string, messages: [] }
-    if (!result.value || result.value.trim().length === 0) {
+    if (!hasText(result.value)) {
       throw new Error('DOCX contains no extractable text content');
     }
     
@@ -9,7 +9,17 @@
  * Configuration via environment variables (no LLMConfigLoader)
  */
 
-import { getEmbeddingsConfig, type EmbeddingsConfig } from '../config/embeddings-config.js';
+import { createHash } from 'crypto';
+import { getEmbeddingsConfig } from '../config/embeddings-config.js';
+import { LRUCache } from '../utils/lru-cache.js';
+import { dotProduct, l2Norm, selectTopK, toFloat32 } from '../utils/vector-math.js';
+import { debugLog, throttledWarn } from '../utils/logger.js';
+import { hasText } from '../utils/text.js';
+
+const CONTROL_CHAR = /[\x00-\x08\x0B\x0E-\x1F]/;
+const CONTROL_CHARS = /[\x00-\x08\x0B\x0E-\x1F]/g;
+const LONE_SURROGATE = /[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]/;
+const LONE_SURROGATES = new RegExp(LONE_SURROGATE.source, 'g');
 
 /**
  * Sanitize text for embedding API by removing/replacing invalid Unicode
@@ -27,61 +37,21 @@ import { getEmbeddingsConfig, type EmbeddingsConfig } from '../config/embeddings
  * @returns Sanitized text safe for JSON serialization and embedding APIs
  */
 export function sanitizeTextForEmbedding(text: string): string {
-  // Fast path: if no potential issues, return as-is
-  // Check for control chars (0x00-0x08, 0x0B, 0x0E-0x1F) or surrogate range (0xD800-0xDFFF)
-  let needsSanitization = false;
-  for (let i = 0; i < Math.min(text.length, 1000); i++) {
-    const code = text.charCodeAt(i);
-    if ((code >= 0x00 && code <= 0x08) || code === 0x0B || (code >= 0x0E && code <= 0x1F) ||
-        (code >= 0xD800 && code <= 0xDFFF)) {
-      needsSanitization = true;
-      break;
-    }
-  }
-  
-  // If sample looks clean, do a full check only if the text is short
-  if (!needsSanitization && text.length <= 1000) {
-    return text;
+  // Two native regex passes instead of rebuilding the string one character at
+  // a time - files are usually clean, so test() lets them through untouched
+  let sanitized = text;
+
+  // Problematic control characters (keep tab, newline, carriage return, form feed)
+  if (CONTROL_CHAR.test(sanitized)) {
+    sanitized = sanitized.replace(CONTROL_CHARS, ' ');
   }
-  
-  // For longer texts or those with issues, do full sanitization
-  const result: string[] = [];
-  
-  for (let i = 0; i < text.length; i++) {
-    const code = text.charCodeAt(i);
-    
-    // Skip problematic control characters (keep tab, newline, carriage return, form feed)
-    if ((code >= 0x00 && code <= 0x08) || code === 0x0B || (code >= 0x0E && code <= 0x1F)) {
-      result.push(' '); // Replace with space
-      continue;
-    }
-    
-    // Handle surrogate pairs
-    if (code >= 0xD800 && code <= 0xDBFF) {
-      // High surrogate - check if followed by low surrogate
-      const nextCode = i + 1 < text.length ? text.charCodeAt(i + 1) : 0;
-      if (nextCode >= 0xDC00 && nextCode <= 0xDFFF) {
-        // Valid surrogate pair - keep both
-        result.push(text[i], text[i + 1]);
-        i++; // Skip the low surrogate
-      } else {
-        // Lone high surrogate - replace with Unicode replacement character
-        result.push('\uFFFD');
-      }
-      continue;
-    }
-    
-    if (code >= 0xDC00 && code <= 0xDFFF) {
-      // Lone low surrogate (without preceding high surrogate) - replace
-      result.push('\uFFFD');
-      continue;
-    }
-    
-    // All other characters are safe
-    result.push(text[i]);
+
+  // Lone surrogates -> Unicode replacement character; valid pairs (emojis) are kept
+  if (LONE_SURROGATE.test(sanitized)) {
+    sanitized = sanitized.replace(LONE_SURROGATES, '\uFFFD');
   }
-  
-  return result.join('');
+
+  return sanitized;
 }
 
 export interface EmbeddingResult {
@@ -133,34 +103,45 @@ export interface FileMetadata {
  * // Returns: "This is a typescript file named auth-api.ts located at src/api/auth-api.ts in the src/api directory."
  */
 export function formatMetadataForEmbedding(metadata: FileMetadata): string {
-  const parts: string[] = [];
-  
-  // Core identification - always include
-  if (metadata.language) {
-    parts.push(`This is a ${metadata.language} file`);
-  } else {
-    parts.push(`This is a file`);
-  }
-  
-  if (metadata.name) {
-    parts.push(`named ${metadata.name}`);
+  // Built as one template per file (runs for every indexed file) rather than
+  // collecting fragments in an array and joining them
+  const language = metadata.language ? `This is a ${metadata.language} file` : 'This is a file';
+  const name = metadata.name ? ` named ${metadata.name}` : '';
+  const location = metadata.relativePath ? ` located at ${metadata.relativePath}` : '';
+  const directory = metadata.directory && metadata.directory !== '.' ? ` in the ${metadata.directory} directory` : '';
+
+  // Natural language sentence plus a blank-line separator before the content
+  return `${language}${name}${location}${directory}.\n\n`;
+}
+
+/**
+ * Scale an embedding to unit length (L2 norm = 1)
+ * 
+ * Stored and query embeddings are normalized once at generation time so that
+ * cosine similarity collapses to a plain dot product - the stored vector norm
+ * never has to be recomputed per comparison. Zero vectors are returned as-is.
+ * 
+ * @param embedding - Raw embedding from the provider
+ * @returns Unit-length copy of the embedding
+ * 
+ * @example
+ * normalizeEmbedding([3, 4]); // [0.6, 0.8]
+ */
+export function normalizeEmbedding(embedding: number[]): number[] {
+  let normSq = 0;
+  for (let i = 0; i < embedding.length; i++) {
+    normSq += embedding[i] * embedding[i];
   }
-  
-  // Location context
-  if (metadata.relativePath) {
-    parts.push(`located at ${metadata.relativePath}`);
+  if (normSq === 0) {
+    return embedding;
   }
-  
-  // Directory context (if different from what's in path)
-  if (metadata.directory && metadata.directory !== '.') {
-    parts.push(`in the ${metadata.directory} directory`);
+
+  const invNorm = 1 / Math.sqrt(normSq);
+  const normalized = new Array<number>(embedding.length);
+  for (let i = 0; i < embedding.length; i++) {
+    normalized[i] = embedding[i] * invNorm;
   }
-  
-  // Join with natural language flow
-  const metadataText = parts.join(' ') + '.';
-  
-  // Add separator for clarity
-  return metadataText + '\n\n';
+  return normalized;
 }
 
 // Chunking configuration based on model context limits
@@ -174,6 +155,107 @@ const getMaxRetries = () => parseInt(process.env.MIMIR_EMBEDDINGS_MAX_RETRIES ||
 const getModelLoadingBaseDelay = () => parseInt(process.env.MIMIR_EMBEDDINGS_MODEL_LOADING_DELAY || '5000', 10);
 // Maximum delay cap (ms)
 const getMaxDelay = () => parseInt(process.env.MIMIR_EMBEDDINGS_MAX_DELAY || '30000', 10);
+// Embedding LRU cache size (entries); 0 disables caching
+const getEmbeddingCacheSize = () => parseInt(process.env.MIMIR_EMBEDDINGS_CACHE_SIZE || '1024', 10);
+// Micro-batching window (ms) for concurrent single-text Ollama requests; 0 disables
+const getBatchWindowMs = () => parseInt(process.env.MIMIR_EMBEDDINGS_BATCH_WINDOW_MS || '20', 10);
+// Maximum texts per coalesced /api/embed request
+const getBatchSize = () => parseInt(process.env.MIMIR_EMBEDDINGS_BATCH_SIZE || '32', 10);
+// OpenAI-compatible response encoding: 'float' (JSON number list) or 'base64' (packed float32)
+const getEncodingFormat = () => process.env.MIMIR_EMBEDDINGS_ENCODING_FORMAT || 'float';
+
+/**
+ * Decode a base64 `encoding_format` embedding (little-endian float32)
+ *
+ * The packed form is about a third of the size of the JSON number list and
+ * skips parsing 1000+ float literals per response.
+ *
+ * @example
+ * decodeBase64Embedding(Buffer.from(Float32Array.of(0.5, -1).buffer).toString('base64')); // [0.5, -1]
+ */
+function decodeBase64Embedding(encoded: string): number[] {
+  const bytes = Buffer.from(encoded, 'base64');
+  const embedding = new Array<number>(bytes.length >> 2);
+  for (let i = 0; i < embedding.length; i++) {
+    embedding[i] = bytes.readFloatLE(i * 4);
+  }
+  return embedding;
+}
+
+// Shared across EmbeddingsService instances - search tools create a service per call.
+// Created on first use: this module loads before http-server runs dotenv.config()
+let embeddingCacheInstance: LRUCache<string, EmbeddingResult> | null = null;
+function embeddingCache(): LRUCache<string, EmbeddingResult> {
+  return embeddingCacheInstance ??= new LRUCache({ maxSize: getEmbeddingCacheSize() });
+}
+const inflightEmbeddings = new Map<string, Promise<EmbeddingResult>>();
+
+// Pending single-text requests per server URL + model, flushed as one /api/embed call
+interface PendingEmbedding {
+  text: string;
+  resolve: (embedding: number[]) => void;
+  reject: (error: any) => void;
+}
+const pendingBatches = new Map<string, { items: PendingEmbedding[]; timer: NodeJS.Timeout | null }>();
+
+// Ollama batch responses meaning "this server has no /api/embed" (older
+// Ollama, or a proxy that only forwards the configured path)
+const OLLAMA_BATCH_UNSUPPORTED = /^Ollama batch API error \((404|405|501)\)/;
+// OpenAI-compatible statuses meaning "array input not accepted" - unlike
+// 401/403 (auth) or 429 (rate limit), which must reach the caller
+const OPENAI_BATCH_UNSUPPORTED = /^OpenAI batch API error \((400|404|413|422)\)/;
+
+/**
+ * End offset of the chunk starting at `start`
+ *
+ * Prefers a paragraph break, then a sentence break, then a word break in the
+ * second half of the window; otherwise cuts at `start + chunkSize`. Each
+ * separator search is confined to that half window - a plain
+ * lastIndexOf(separator, end) keeps scanning back towards offset 0 when the
+ * separator is absent, so text without blank lines (minified code, PDF
+ * extracts) rescanned its whole prefix once per chunk.
+ *
+ * @example
+ * findChunkEnd('aaaa. bbbb cccc', 0, 12); // 11 - word break after "bbbb " (the sentence break is in the first half)
+ */
+function findChunkEnd(text: string, start: number, chunkSize: number): number {
+  const end = start + chunkSize;
+  if (end >= text.length) return end;
+
+  // Breaks must land strictly after the middle of the window
+  const from = Math.floor(start + chunkSize / 2) + 1;
+  for (const separator of ['\n\n', '. ', ' ']) {
+    const index = text.slice(from, end + separator.length).lastIndexOf(separator);
+    if (index !== -1) return from + index + separator.length;
+  }
+  return end;
+}
+
+function embeddingCacheKey(provider: string, model: string, text: string): string {
+  return createHash('sha256').update(`${provider}|${model}|`).update(text).digest('base64');
+}
+
+type EmbeddingsApi = 'ollama-embed' | 'ollama-embeddings' | 'openai';
+
+interface EmbeddingsEndpoint {
+  url: string;
+  headers: Readonly<Record<string, string>>;
+  // Serialized request fields up to the texts, e.g. `{"model":"m","input":`
+  bodyPrefix: string;
+}
+
+/**
+ * Request body for an endpoint: the cached prefix plus the serialized input
+ *
+ * Only the texts change between requests, so the model name and fixed
+ * options are not rebuilt into a fresh object and re-stringified each time.
+ *
+ * @example
+ * requestBody({ bodyPrefix: '{"model":"m","input":' } as EmbeddingsEndpoint, ['a']); // '{"model":"m","input":["a"]}'
+ */
+function requestBody(endpoint: EmbeddingsEndpoint, input: unknown): string {
+  return `${endpoint.bodyPrefix}${JSON.stringify(input)}}`;
+}
 
 export class EmbeddingsService {
   public enabled: boolean = false;
@@ -181,6 +263,12 @@ export class EmbeddingsService {
   private baseUrl: string = 'http://localhost:11434';
   private model: string = 'nomic-embed-text';
   private apiKey: string = 'dummy-key-not-used';
+  // Request URL and headers per provider API, built on first use (see getEndpoint)
+  private endpoints = new Map<EmbeddingsApi, EmbeddingsEndpoint>();
+  // Set once the OpenAI-compatible server rejects array input (see generateOpenAIBatchEmbeddings)
+  private openAIBatchUnsupported = false;
+  // Set once the Ollama server turns out not to serve /api/embed (see embedOllamaTexts)
+  private ollamaBatchUnsupported = false;
 
   constructor() {
     // No dependencies - config from environment
@@ -232,6 +320,9 @@ export class EmbeddingsService {
     this.model = config.model;
     this.baseUrl = config.baseUrl;
     this.apiKey = config.apiKey;
+    this.endpoints.clear();
+    this.openAIBatchUnsupported = false;
+    this.ollamaBatchUnsupported = false;
 
     console.log(`✅ Vector embeddings enabled: ${config.provider}/${config.model}`);
     console.log(`   Base URL: ${this.baseUrl}`);
@@ -272,41 +363,22 @@ export class EmbeddingsService {
    * Uses sliding window with overlap to maintain context
    */
   private chunkText(text: string): string[] {
-    if (text.length <= getChunkSize()) {
+    const chunkSize = getChunkSize();
+    if (text.length <= chunkSize) {
       return [text];
     }
 
+    const chunkOverlap = getChunkOverlap();
     const chunks: string[] = [];
     let start = 0;
 
     while (start < text.length) {
-      let end = start + getChunkSize();
-      
-      // If this isn't the last chunk, try to break at a natural boundary
-      if (end < text.length) {
-        // Try to break at paragraph boundary
-        const paragraphBreak = text.lastIndexOf('\n\n', end);
-        if (paragraphBreak > start + getChunkSize() / 2) {
-          end = paragraphBreak + 2;
-        } else {
-          // Try to break at sentence boundary
-          const sentenceBreak = text.lastIndexOf('. ', end);
-          if (sentenceBreak > start + getChunkSize() / 2) {
-            end = sentenceBreak + 2;
-          } else {
-            // Try to break at word boundary
-            const wordBreak = text.lastIndexOf(' ', end);
-            if (wordBreak > start + getChunkSize() / 2) {
-              end = wordBreak + 1;
-            }
-          }
-        }
-      }
+      const end = findChunkEnd(text, start, chunkSize);
 
       chunks.push(text.substring(start, end).trim());
       
       // Move start position with overlap for context continuity
-      start = end - getChunkOverlap();
+      start = end - chunkOverlap;
       if (start < 0) start = 0;
     }
 
@@ -353,10 +425,39 @@ export class EmbeddingsService {
       throw new Error('Embeddings not enabled. Check embeddings.enabled in config');
     }
 
-    if (!text || text.trim().length === 0) {
+    if (!hasText(text)) {
       throw new Error('Cannot generate embedding for empty text');
     }
 
+    // Repeated texts (re-asked queries, unchanged nodes) skip the provider call;
+    // concurrent requests for the same text share one in-flight call
+    const cacheKey = embeddingCacheKey(this.provider, this.model, text);
+    const cached = embeddingCache().get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
+    const pending = inflightEmbeddings.get(cacheKey);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.computeEmbedding(text)
+      .then(result => {
+        embeddingCache().set(cacheKey, result);
+        return result;
+      })
+      .finally(() => {
+        inflightEmbeddings.delete(cacheKey);
+      });
+    inflightEmbeddings.set(cacheKey, request);
+    return request;
+  }
+
+  /**
+   * Generate an embedding without consulting the cache (see generateEmbedding)
+   */
+  private async computeEmbedding(text: string): Promise<EmbeddingResult> {
     // Chunk text if it's too large
     const chunks = this.chunkText(text);
     
@@ -364,31 +465,43 @@ export class EmbeddingsService {
     if (chunks.length === 1) {
       if (this.provider === 'copilot' || this.provider === 'openai' || this.provider === 'llama.cpp') {
         return this.generateOpenAIEmbedding(text);
+      } else if (getBatchWindowMs() > 0) {
+        return this.enqueueOllamaEmbedding(text);
       } else {
         return this.generateOllamaEmbedding(text);
       }
     }
 
     // For multiple chunks, generate embeddings for each and average them
-    console.log(`📄 Chunking large text into ${chunks.length} pieces`);
+    debugLog(`📄 Chunking large text into ${chunks.length} pieces`);
     const embeddings: number[][] = [];
     
-    for (let i = 0; i < chunks.length; i++) {
-      try {
-        let result: EmbeddingResult;
-        if (this.provider === 'copilot' || this.provider === 'openai' || this.provider === 'llama.cpp') {
-          result = await this.generateOpenAIEmbedding(chunks[i]);
+    if (this.provider === 'ollama' && getBatchWindowMs() > 0) {
+      // Queue every chunk at once: the micro-batcher sends them as /api/embed
+      // calls of up to MIMIR_EMBEDDINGS_BATCH_SIZE texts over the kept-alive
+      // connection instead of one round trip per chunk
+      const settled = await Promise.allSettled(chunks.map(chunk => this.enqueueOllamaEmbedding(chunk)));
+      settled.forEach((outcome, i) => {
+        if (outcome.status === 'fulfilled') {
+          embeddings.push(outcome.value.embedding);
         } else {
-          result = await this.generateOllamaEmbedding(chunks[i]);
+          console.warn(`⚠️  Failed to generate embedding for chunk ${i + 1}/${chunks.length}: ${outcome.reason?.message}`);
+        }
+      });
+    } else {
+      for (let i = 0; i < chunks.length; i++) {
+        try {
+          let result: EmbeddingResult;
+          if (this.provider === 'copilot' || this.provider === 'openai' || this.provider === 'llama.cpp') {
+            result = await this.generateOpenAIEmbedding(chunks[i]);
+          } else {
+            result = await this.generateOllamaEmbedding(chunks[i]);
+          }
+          embeddings.push(result.embedding);
+        } catch (error: any) {
+          console.warn(`⚠️  Failed to generate embedding for chunk ${i + 1}/${chunks.length}: ${error.message}`);
+          // Continue with other chunks
         }
-        embeddings.push(result.embedding);
-
-        // TODO: For cloud APIs (OpenAI, etc) implement proper rate limiting
-        // with token bucket or sliding window instead of fixed delay.
-        // Local Ollama doesn't need throttling.
-      } catch (error: any) {
-        console.warn(`⚠️  Failed to generate embedding for chunk ${i + 1}/${chunks.length}: ${error.message}`);
-        // Continue with other chunks
       }
     }
 
@@ -396,27 +509,156 @@ export class EmbeddingsService {
       throw new Error('Failed to generate embeddings for all chunks');
     }
 
-    // Average the embeddings
+    // Average the embeddings. Normalizing the sum gives the same unit vector
+    // as normalizing the mean, so the divide-by-count pass is skipped
     const dimensions = embeddings[0].length;
-    const avgEmbedding = new Array(dimensions).fill(0);
+    const sumEmbedding = new Array(dimensions).fill(0);
     
     for (const emb of embeddings) {
       for (let i = 0; i < dimensions; i++) {
-        avgEmbedding[i] += emb[i];
+        sumEmbedding[i] += emb[i];
       }
     }
-    
-    for (let i = 0; i < dimensions; i++) {
-      avgEmbedding[i] /= embeddings.length;
-    }
 
     return {
-      embedding: avgEmbedding,
+      embedding: normalizeEmbedding(sumEmbedding),
       dimensions: dimensions,
       model: this.model,
     };
   }
 
+  /**
+   * Queue a single text for the next coalesced Ollama /api/embed request
+   * 
+   * Requests arriving within MIMIR_EMBEDDINGS_BATCH_WINDOW_MS of each other
+   * (e.g. parallel searches) are sent as one batch, up to
+   * MIMIR_EMBEDDINGS_BATCH_SIZE texts, so the model runs one batched forward
+   * pass instead of one pass per request.
+   */
+  private enqueueOllamaEmbedding(text: string): Promise<EmbeddingResult> {
+    if (!this.canBatchOllama()) {
+      return this.generateOllamaEmbedding(text);
+    }
+
+    // Services pointed at different servers must never share a batch
+    const key = `${this.getEndpoint('ollama-embed').url}|${this.model}`;
+    return new Promise<number[]>((resolve, reject) => {
+      let batch = pendingBatches.get(key);
+      if (!batch) {
+        batch = { items: [], timer: null };
+        pendingBatches.set(key, batch);
+      }
+      batch.items.push({ text, resolve, reject });
+
+      if (batch.items.length >= getBatchSize()) {
+        this.flushOllamaBatch(key);
+      } else if (!batch.timer) {
+        batch.timer = setTimeout(() => this.flushOllamaBatch(key), getBatchWindowMs());
+      }
+    }).then(embedding => ({
+      embedding,
+      dimensions: embedding.length,
+      model: this.model,
+    }));
+  }
+
+  /**
+   * Send all queued texts for one server + model in one batch request
+   *
+   * A lone text (no concurrent request arrived within the window) goes to
+   * the configured single-text endpoint with its own retries instead.
+   */
+  private flushOllamaBatch(key: string): void {
+    const batch = pendingBatches.get(key);
+    if (!batch) return;
+    pendingBatches.delete(key);
+    if (batch.timer) clearTimeout(batch.timer);
+
+    const items = batch.items;
+    if (items.length === 0) return;
+
+    // One text at a time: a failed batch must not turn into a burst of up to
+    // MIMIR_EMBEDDINGS_BATCH_SIZE concurrent requests against the same server
+    const embedIndividually = async (): Promise<void> => {
+      for (const item of items) {
+        try {
+          item.resolve((await this.generateOllamaEmbedding(item.text)).embedding);
+        } catch (itemError) {
+          item.reject(itemError);
+        }
+      }
+    };
+
+    if (items.length === 1 || !this.canBatchOllama()) {
+      embedIndividually();
+      return;
+    }
+
+    this.generateOllamaBatchEmbeddings(items.map(item => item.text)).then(
+      embeddings => {
+        items.forEach((item, idx) => {
+          if (Array.isArray(embeddings[idx])) {
+            item.resolve(embeddings[idx]);
+          } else {
+            item.reject(new Error('Invalid response from Ollama batch: missing embedding'));
+          }
+        });
+      },
+      error => {
+        if (OLLAMA_BATCH_UNSUPPORTED.test(error.message ?? '')) {
+          this.ollamaBatchUnsupported = true;
+        }
+        // One bad input fails the whole batch - retry individually so the
+        // error only reaches the caller that caused it
+        console.warn(`⚠️  Batched embedding failed (${error.message}), retrying ${items.length} texts individually`);
+        embedIndividually();
+      }
+    );
+  }
+
+  /**
+   * Whether texts may go to Ollama's /api/embed batch endpoint
+   *
+   * Not when MIMIR_EMBEDDINGS_API_PATH points elsewhere (the server or proxy
+   * may only serve that path), nor once the server answered /api/embed with
+   * "not found / not supported".
+   */
+  private canBatchOllama(): boolean {
+    const apiPath = process.env.MIMIR_EMBEDDINGS_API_PATH;
+    return !this.ollamaBatchUnsupported && (!apiPath || apiPath === '/api/embed');
+  }
+
+  /**
+   * Embed several texts with Ollama, batched when the server supports it
+   *
+   * Falls back to one request per text on the configured path when batching
+   * is unavailable or /api/embed turns out not to exist.
+   */
+  private async embedOllamaTexts(texts: string[]): Promise<number[][]> {
+    const sequential = async (): Promise<number[][]> => {
+      const embeddings: number[][] = [];
+      for (const text of texts) {
+        embeddings.push((await this.generateOllamaEmbedding(text)).embedding);
+      }
+      return embeddings;
+    };
+
+    if (texts.length === 1 || !this.canBatchOllama()) {
+      return sequential();
+    }
+
+    try {
+      return await this.generateOllamaBatchEmbeddings(texts);
+    } catch (error: any) {
+      if (!OLLAMA_BATCH_UNSUPPORTED.test(error.message ?? '')) {
+        throw error;
+      }
+      console.warn(`⚠️  Ollama server has no batch endpoint, falling back to one text per request: ${error.message}`);
+      this.ollamaBatchUnsupported = true;
+      return sequential();
+    }
+  }
+
   /**
    * Generate separate embeddings for each text chunk (Industry Standard)
    * 
@@ -483,7 +725,7 @@ export class EmbeddingsService {
       throw new Error('Embeddings not enabled. Check embeddings.enabled in config');
     }
 
-    if (!text || text.trim().length === 0) {
+    if (!hasText(text)) {
       throw new Error('Cannot generate embeddings for empty text');
     }
 
@@ -495,25 +737,7 @@ export class EmbeddingsService {
     let start = 0;
 
     while (start < text.length) {
-      let end = start + chunkSize;
-
-      // Try to break at natural boundary
-      if (end < text.length) {
-        const paragraphBreak = text.lastIndexOf('\n\n', end);
-        if (paragraphBreak > start + chunkSize / 2) {
-          end = paragraphBreak + 2;
-        } else {
-          const sentenceBreak = text.lastIndexOf('. ', end);
-          if (sentenceBreak > start + chunkSize / 2) {
-            end = sentenceBreak + 2;
-          } else {
-            const wordBreak = text.lastIndexOf(' ', end);
-            if (wordBreak > start + chunkSize / 2) {
-              end = wordBreak + 1;
-            }
-          }
-        }
-      }
+      const end = findChunkEnd(text, start, chunkSize);
 
       const chunkText = text.substring(start, end).trim();
       if (chunkText.length > 0) {
@@ -529,19 +753,31 @@ export class EmbeddingsService {
       throw new Error('No valid chunks generated from text');
     }
 
-    // Step 2: Generate embeddings (batch for Ollama, sequential for others)
-    let embeddings: number[][];
-
-    if (this.provider === 'ollama') {
-      // Batch API for Ollama - much faster
-      embeddings = await this.generateOllamaBatchEmbeddings(textChunks.map(c => c.text));
-    } else {
-      // Sequential for OpenAI/Copilot (they have their own batching)
-      embeddings = [];
-      for (const chunk of textChunks) {
-        const result = await this.generateOpenAIEmbedding(chunk.text);
-        embeddings.push(result.embedding);
+    // Step 2: Generate embeddings (batched per provider API)
+    // Chunks seen before (re-indexing an edited file, shared boilerplate) come
+    // from the embedding cache; only the misses go to the provider
+    const cacheKeys = textChunks.map(c => embeddingCacheKey(this.provider, this.model, c.text));
+    const embeddings: number[][] = cacheKeys.map(key => embeddingCache().get(key)?.embedding ?? []);
+    const missing = embeddings.flatMap((embedding, idx) => embedding.length === 0 ? [idx] : []);
+
+    if (missing.length > 0) {
+      let fresh: number[][];
+      if (this.provider === 'ollama') {
+        // Batch API for Ollama - much faster (falls back when unavailable)
+        fresh = await this.embedOllamaTexts(missing.map(idx => textChunks[idx].text));
+      } else {
+        // OpenAI-compatible /v1/embeddings takes an input array too
+        fresh = await this.generateOpenAIBatchEmbeddings(missing.map(idx => textChunks[idx].text));
       }
+
+      missing.forEach((idx, i) => {
+        embeddings[idx] = fresh[i];
+        embeddingCache().set(cacheKeys[idx], {
+          embedding: fresh[i],
+          dimensions: fresh[i].length,
+          model: this.model,
+        });
+      });
     }
 
     // Step 3: Build results
@@ -555,7 +791,7 @@ export class EmbeddingsService {
       chunkIndex: idx
     }));
 
-    console.log(`📄 Generated ${results.length} chunk embeddings (batch) for text (${text.length} chars)`);
+    debugLog(`📄 Generated ${results.length} chunk embeddings (batch) for text (${text.length} chars)`);
     return results;
   }
 
@@ -566,22 +802,12 @@ export class EmbeddingsService {
     const sanitizedTexts = texts.map(t => sanitizeTextForEmbedding(t));
 
     return this.retryWithBackoff(async () => {
-      const baseUrl = process.env.MIMIR_EMBEDDINGS_API || this.baseUrl || 'http://localhost:11434';
-      const batchUrl = `${baseUrl}/api/embed`;
-      const apiKey = process.env.MIMIR_EMBEDDINGS_API_KEY;
-
-      const headers: Record<string, string> = { 'Content-Type': 'application/json' };
-      if (apiKey && apiKey !== 'dummy-key') {
-        headers['Authorization'] = `Bearer ${apiKey}`;
-      }
+      const endpoint = this.getEndpoint('ollama-embed');
 
-      const response = await fetch(batchUrl, {
+      const response = await fetch(endpoint.url, {
         method: 'POST',
-        headers,
-        body: JSON.stringify({
-          model: this.model,
-          input: sanitizedTexts,
-        }),
+        headers: endpoint.headers,
+        body: requestBody(endpoint, sanitizedTexts),
       });
 
       if (!response.ok) {
@@ -595,10 +821,131 @@ export class EmbeddingsService {
         throw new Error('Invalid response from Ollama batch: missing embeddings array');
       }
 
-      return data.embeddings;
+      return data.embeddings.map((embedding: number[]) => normalizeEmbedding(embedding));
     }, `Ollama batch embedding (${texts.length} chunks)`);
   }
 
+  /**
+   * Batch embedding generation for OpenAI/Copilot/llama.cpp
+   *
+   * Posts the texts as `input` arrays of up to MIMIR_EMBEDDINGS_BATCH_SIZE,
+   * so a file of N chunks costs ceil(N / batch size) round trips instead of N.
+   * Batches go out one after another to stay clear of cloud rate limits. A
+   * server that rejects array input (400/404/413/422) is remembered and
+   * served one text per request from then on; auth, rate-limit and transient
+   * errors are rethrown and never latch.
+   */
+  private async generateOpenAIBatchEmbeddings(texts: string[]): Promise<number[][]> {
+    const sequential = async (batch: string[]): Promise<number[][]> => {
+      const embeddings: number[][] = [];
+      for (const text of batch) {
+        embeddings.push((await this.generateOpenAIEmbedding(text)).embedding);
+      }
+      return embeddings;
+    };
+
+    const batchSize = Math.max(1, getBatchSize());
+    const embeddings: number[][] = [];
+
+    for (let offset = 0; offset < texts.length; offset += batchSize) {
+      const batch = texts.slice(offset, offset + batchSize);
+      // Image data URLs need the multimodal request shape
+      if (this.openAIBatchUnsupported || batch.length === 1 || batch.some(t => t.startsWith('data:image/'))) {
+        embeddings.push(...await sequential(batch));
+        continue;
+      }
+
+      try {
+        embeddings.push(...await this.postOpenAIBatch(batch));
+      } catch (error: any) {
+        if (!OPENAI_BATCH_UNSUPPORTED.test(error.message ?? '')) {
+          throw error;
+        }
+        console.warn(`⚠️  Embeddings server rejected batched input, falling back to one text per request: ${error.message}`);
+        this.openAIBatchUnsupported = true;
+        embeddings.push(...await sequential(batch));
+      }
+    }
+
+    return embeddings;
+  }
+
+  /**
+   * One /v1/embeddings request for a batch of texts, results in input order
+   */
+  private async postOpenAIBatch(texts: string[]): Promise<number[][]> {
+    const sanitizedTexts = texts.map(t => sanitizeTextForEmbedding(t));
+
+    return this.retryWithBackoff(async () => {
+      const endpoint = this.getEndpoint('openai');
+
+      const response = await fetch(endpoint.url, {
+        method: 'POST',
+        headers: endpoint.headers,
+        body: requestBody(endpoint, sanitizedTexts),
+      });
+
+      if (!response.ok) {
+        const errorText = await response.text();
+        throw new Error(`OpenAI batch API error (${response.status}): ${errorText}`);
+      }
+
+      const data = await response.json();
+
+      if (!Array.isArray(data.data) || data.data.length !== texts.length) {
+        throw new Error(`Invalid response from OpenAI batch: expected ${texts.length} embeddings, got ${data.data?.length ?? 0}`);
+      }
+
+      // The spec tags each item with its input index; don't rely on response order
+      const embeddings: number[][] = new Array(texts.length);
+      data.data.forEach((item: { index?: number; embedding: number[] | string }, i: number) => {
+        const embedding = typeof item.embedding === 'string' ? decodeBase64Embedding(item.embedding) : item.embedding;
+        if (!Array.isArray(embedding)) {
+          throw new Error('Invalid response from OpenAI batch: embedding is not an array');
+        }
+        embeddings[item.index ?? i] = normalizeEmbedding(embedding);
+      });
+      return embeddings;
+    }, `OpenAI batch embedding (${texts.length} chunks)`);
+  }
+
+  /**
+   * URL, headers and body prefix for a provider API, built once per service
+   *
+   * Base URL, path, key and encoding format come from the environment
+   * (already loaded by the first request) and never change between calls, so they are not re-read
+   * and re-assembled for each of the thousands of requests in an indexing run.
+   * The headers object is shared - fetch copies it and never mutates it.
+   */
+  private getEndpoint(api: EmbeddingsApi): EmbeddingsEndpoint {
+    let endpoint = this.endpoints.get(api);
+    if (endpoint) return endpoint;
+
+    // Simple concatenation: base URL + path
+    const baseUrl = process.env.MIMIR_EMBEDDINGS_API || this.baseUrl || 'http://localhost:11434';
+    const path = api === 'ollama-embed'
+      ? '/api/embed'
+      : process.env.MIMIR_EMBEDDINGS_API_PATH || (api === 'openai' ? '/v1/embeddings' : '/api/embeddings');
+    const apiKey = api === 'openai'
+      ? process.env.MIMIR_EMBEDDINGS_API_KEY || this.apiKey
+      : process.env.MIMIR_EMBEDDINGS_API_KEY;
+
+    const headers: Record<string, string> = { 'Content-Type': 'application/json' };
+    // llama.cpp doesn't need an Authorization header
+    if (!(api === 'openai' && this.provider === 'llama.cpp') && apiKey && apiKey !== 'dummy-key') {
+      headers['Authorization'] = `Bearer ${apiKey}`;
+    }
+
+    // Ollama's legacy /api/embeddings takes a single `prompt`; the others an `input`
+    const inputField = api === 'ollama-embeddings' ? 'prompt' : 'input';
+    const encodingFormat = api === 'openai' && getEncodingFormat() === 'base64' ? ',"encoding_format":"base64"' : '';
+    const bodyPrefix = `{"model":${JSON.stringify(this.model)}${encodingFormat},"${inputField}":`;
+
+    endpoint = { url: `${baseUrl}${path}`, headers: Object.freeze(headers), bodyPrefix };
+    this.endpoints.set(api, endpoint);
+    return endpoint;
+  }
+
   /**
    * Retry wrapper for embedding generation with exponential backoff
    * Handles EOF errors, 503 (model loading), and other transient failures from Ollama/llama.cpp
@@ -677,14 +1024,15 @@ export class EmbeddingsService {
                          isFetchFailed ? 'fetch failed' : 'EOF';
 
         // Special message for connection refused - waiting for server
+        // Throttled per error type: concurrent requests fail together
         if (isConnectionRefused) {
           if (attempt < maxRetries) {
-            console.warn(`⏳ Embedding server unavailable. Waiting ${Math.round(delayMs / 1000)}s before retry (${attempt + 1}/${maxRetries + 1})...`);
+            throttledWarn(`embeddings:${errorType}`, `⏳ Embedding server unavailable. Waiting ${Math.round(delayMs / 1000)}s before retry (${attempt + 1}/${maxRetries + 1})...`);
           } else {
-            console.warn(`⏳ Embedding server still unavailable. Polling every 60s... (attempt ${attempt + 1})`);
+            throttledWarn(`embeddings:${errorType}`, `⏳ Embedding server still unavailable. Polling every 60s... (attempt ${attempt + 1})`);
           }
         } else {
-          console.warn(`⚠️  ${operation} failed with ${errorType} error (attempt ${attempt + 1}/${maxRetries + 1}). Retrying in ${Math.round(delayMs / 1000)}s...`);
+          throttledWarn(`embeddings:${errorType}`, `⚠️  ${operation} failed with ${errorType} error (attempt ${attempt + 1}/${maxRetries + 1}). Retrying in ${Math.round(delayMs / 1000)}s...`);
         }
 
         await new Promise(resolve => setTimeout(resolve, delayMs));
@@ -701,49 +1049,30 @@ export class EmbeddingsService {
     const sanitizedText = sanitizeTextForEmbedding(text);
     
     return this.retryWithBackoff(async () => {
-      try {
-        // Simple concatenation: base URL + path
-        const baseUrl = process.env.MIMIR_EMBEDDINGS_API || this.baseUrl || 'http://localhost:11434';
-        const embeddingsPath = process.env.MIMIR_EMBEDDINGS_API_PATH || '/api/embeddings';
-        const embeddingsUrl = `${baseUrl}${embeddingsPath}`;
-        const apiKey = process.env.MIMIR_EMBEDDINGS_API_KEY;
-        
-        const headers: Record<string, string> = {
-          'Content-Type': 'application/json',
-        };
-        if (apiKey && apiKey !== 'dummy-key') {
-          headers['Authorization'] = `Bearer ${apiKey}`;
-        }
-        
-        const response = await fetch(embeddingsUrl, {
-          method: 'POST',
-          headers,
-          body: JSON.stringify({
-            model: this.model,
-            prompt: sanitizedText,
-          }),
-        });
-
-        if (!response.ok) {
-          const errorText = await response.text();
-          throw new Error(`Ollama API error (${response.status}): ${errorText}`);
-        }
-
-        const data = await response.json();
-        
-        if (!data.embedding || !Array.isArray(data.embedding)) {
-          throw new Error('Invalid response from Ollama: missing embedding array');
-        }
+      const endpoint = this.getEndpoint('ollama-embeddings');
+      
+      const response = await fetch(endpoint.url, {
+        method: 'POST',
+        headers: endpoint.headers,
+        body: requestBody(endpoint, sanitizedText),
+      });
 
-        return {
-          embedding: data.embedding,
-          dimensions: data.embedding.length,
-          model: this.model,
-        };
+      if (!response.ok) {
+        const errorText = await response.text();
+        throw new Error(`Ollama API error (${response.status}): ${errorText}`);
+      }
 
-      } catch (error: any) {
-        throw error;
+      const data = await response.json();
+      
+      if (!data.embedding || !Array.isArray(data.embedding)) {
+        throw new Error('Invalid response from Ollama: missing embedding array');
       }
+
+      return {
+        embedding: normalizeEmbedding(data.embedding),
+        dimensions: data.embedding.length,
+        model: this.model,
+      };
     }, `Ollama embedding (${text.substring(0, 50)}...)`);
   }
 
@@ -755,137 +1084,130 @@ export class EmbeddingsService {
     const sanitizedText = sanitizeTextForEmbedding(text);
     
     return this.retryWithBackoff(async () => {
-      try {
-        // Simple concatenation: base URL + path
-        const baseUrl = process.env.MIMIR_EMBEDDINGS_API || this.baseUrl || 'http://localhost:11434';
-        const embeddingsPath = process.env.MIMIR_EMBEDDINGS_API_PATH || '/v1/embeddings';
-        const embeddingsUrl = `${baseUrl}${embeddingsPath}`;
-        const apiKey = process.env.MIMIR_EMBEDDINGS_API_KEY || this.apiKey;
-        
-        // Build headers - llama.cpp doesn't need Authorization header
-        const headers: Record<string, string> = {
-          'Content-Type': 'application/json',
-        };
-        
-        // Only add Authorization if we have a key and not llama.cpp
-        if (this.provider !== 'llama.cpp' && apiKey && apiKey !== 'dummy-key') {
-          headers['Authorization'] = `Bearer ${apiKey}`;
-        }
-        
-        // Detect if input is a data URL (image) for multimodal embeddings
-        const isDataURL = sanitizedText.startsWith('data:image/');
-        
-        // For multimodal embeddings, send as array with image object
-        // For text embeddings, send as string
-        const input = isDataURL 
-          ? [{ type: 'image_url', image_url: { url: sanitizedText } }]
-          : sanitizedText;
-        
-        const requestBody = JSON.stringify({
-          model: this.model,
-          input: input,
-        });
-        
-        const response = await fetch(embeddingsUrl, {
-          method: 'POST',
-          headers,
-          body: requestBody,
-        });
-
-        if (!response.ok) {
-          const errorText = await response.text();
-          throw new Error(`OpenAI API error (${response.status}): ${errorText}`);
-        }
-
-        const data = await response.json();
-        
-        if (!data.data || !Array.isArray(data.data) || data.data.length === 0) {
-          throw new Error('Invalid response from OpenAI: missing data array');
-        }
+      const endpoint = this.getEndpoint('openai');
+      
+      // Detect if input is a data URL (image) for multimodal embeddings
+      const isDataURL = sanitizedText.startsWith('data:image/');
+      
+      // For multimodal embeddings, send as array with image object
+      // For text embeddings, send as string
+      const input = isDataURL 
+        ? [{ type: 'image_url', image_url: { url: sanitizedText } }]
+        : sanitizedText;
+      
+      const response = await fetch(endpoint.url, {
+        method: 'POST',
+        headers: endpoint.headers,
+        body: requestBody(endpoint, input),
+      });
 
-        const embedding = data.data[0].embedding;
-        
-        if (!Array.isArray(embedding)) {
-          throw new Error('Invalid response from OpenAI: embedding is not an array');
-        }
+      if (!response.ok) {
+        const errorText = await response.text();
+        throw new Error(`OpenAI API error (${response.status}): ${errorText}`);
+      }
 
-        return {
-          embedding: embedding,
-          dimensions: embedding.length,
-          model: this.model,
-        };
+      const data = await response.json();
+      
+      if (!data.data || !Array.isArray(data.data) || data.data.length === 0) {
+        throw new Error('Invalid response from OpenAI: missing data array');
+      }
 
-      } catch (error: any) {
-        throw error;
+      // Servers that ignore encoding_format still answer with a number list
+      const rawEmbedding = data.data[0].embedding;
+      const embedding = typeof rawEmbedding === 'string' ? decodeBase64Embedding(rawEmbedding) : rawEmbedding;
+      
+      if (!Array.isArray(embedding)) {
+        throw new Error('Invalid response from OpenAI: embedding is not an array');
       }
+
+      return {
+        embedding: normalizeEmbedding(embedding),
+        dimensions: embedding.length,
+        model: this.model,
+      };
     }, `OpenAI embedding (${text.substring(0, 50)}...)`);
   }
 
   /**
    * Generate embeddings for multiple texts (batch processing)
+   *
+   * With Ollama and batching enabled, texts are requested
+   * MIMIR_EMBEDDINGS_BATCH_SIZE at a time so the micro-batcher packs each
+   * slice into one /api/embed call - one round trip and one model forward per
+   * batch instead of one per text, with at most one batch in flight. Other
+   * providers stay sequential so cloud rate limits are not hit with a burst.
    */
   async generateEmbeddings(texts: string[]): Promise<EmbeddingResult[]> {
     if (!this.enabled) {
       throw new Error('Embeddings not enabled');
     }
 
+    const embedOne = (text: string): Promise<EmbeddingResult> => {
+      if (hasText(text)) {
+        return this.generateEmbedding(text);
+      }
+      // Empty placeholder for empty texts
+      return Promise.resolve({
+        embedding: [],
+        dimensions: 0,
+        model: this.model,
+      });
+    };
+
     const results: EmbeddingResult[] = [];
-    
-    for (const text of texts) {
-      if (text && text.trim().length > 0) {
-        const result = await this.generateEmbedding(text);
-        results.push(result);
-      } else {
-        // Push empty placeholder for empty texts
-        results.push({
-          embedding: [],
-          dimensions: 0,
-          model: this.model,
-        });
+    if (this.provider === 'ollama' && getBatchWindowMs() > 0) {
+      const batchSize = Math.max(1, getBatchSize());
+      for (let i = 0; i < texts.length; i += batchSize) {
+        results.push(...await Promise.all(texts.slice(i, i + batchSize).map(embedOne)));
       }
+      return results;
     }
 
+    for (const text of texts) {
+      results.push(await embedOne(text));
+    }
     return results;
   }
 
   /**
    * Calculate cosine similarity between two embeddings
    */
-  cosineSimilarity(a: number[], b: number[]): number {
+  cosineSimilarity(a: ArrayLike<number>, b: ArrayLike<number>): number {
     if (a.length !== b.length) {
       throw new Error('Embeddings must have same dimensions');
     }
 
-    let dotProduct = 0;
-    let normA = 0;
-    let normB = 0;
-
-    for (let i = 0; i < a.length; i++) {
-      dotProduct += a[i] * b[i];
-      normA += a[i] * a[i];
-      normB += b[i] * b[i];
-    }
-
-    return dotProduct / (Math.sqrt(normA) * Math.sqrt(normB));
+    const denominator = l2Norm(a) * l2Norm(b);
+    return denominator === 0 ? 0 : dotProduct(a, b) / denominator;
   }
 
   /**
    * Find most similar embeddings using cosine similarity
+   * 
+   * The query is packed into a Float32Array and its norm computed once,
+   * so each candidate costs one dot product plus its own norm.
    */
   findMostSimilar(
     query: number[],
     candidates: Array<{ embedding: number[]; metadata: any }>,
     topK: number = 5
   ): Array<{ similarity: number; metadata: any }> {
-    const similarities = candidates.map(candidate => ({
-      similarity: this.cosineSimilarity(query, candidate.embedding),
-      metadata: candidate.metadata,
-    }));
+    const queryVector = toFloat32(query);
+    const queryNorm = l2Norm(queryVector);
 
-    // Sort by similarity descending
-    similarities.sort((a, b) => b.similarity - a.similarity);
-
-    return similarities.slice(0, topK);
+    const similarities = candidates.map(candidate => {
+      if (candidate.embedding.length !== queryVector.length) {
+        throw new Error('Embeddings must have same dimensions');
+      }
+      const denominator = queryNorm * l2Norm(candidate.embedding);
+      return {
+        similarity: denominator === 0 ? 0 : dotProduct(queryVector, candidate.embedding) / denominator,
+        metadata: candidate.metadata,
+      };
+    });
+
+    // Only the best topK are ordered - no full sort of the pool
+    return selectTopK(similarities, topK, scored => scored.similarity);
   }
 
   /**
@@ -911,6 +1233,9 @@ export class EmbeddingsService {
       const response = await fetch(`${this.baseUrl}/api/tags`);
       
       if (!response.ok) {
+        // Discard the unread body so the keep-alive socket goes back to
+        // fetch's shared pool instead of staying pinned until GC
+        await response.body?.cancel();
         return false;
       }
 
@@ -944,6 +1269,7 @@ export class EmbeddingsService {
       });
       
       if (!response.ok) {
+        await response.body?.cancel();
         console.warn(`⚠️  Cannot verify OpenAI model availability (${response.status})`);
         console.warn(`   Make sure copilot-api is running: copilot-api start`);
         return false;
@@ -9,14 +9,139 @@ import { Driver } from 'neo4j-driver';
 import { promises as fs } from 'fs';
 import path from 'path';
 import { createHash } from 'crypto';
-import { EmbeddingsService, ChunkEmbeddingResult, formatMetadataForEmbedding, FileMetadata } from './EmbeddingsService.js';
+import { EmbeddingsService, formatMetadataForEmbedding, FileMetadata } from './EmbeddingsService.js';
 import { DocumentParser } from './DocumentParser.js';
 import { getHostWorkspaceRoot } from '../utils/path-utils.js';
-import { getEmbeddingsConfig } from '../config/embeddings-config.js';
+import { debugLog } from '../utils/logger.js';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
 
 // Image extensions to skip (no VL service in mimir-lite)
 const IMAGE_EXTENSIONS = new Set(['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.svg', '.ico']);
 
+// shouldSkipFile lookup tables - built once at module load, not per file
+// Binary and non-text file extensions to skip
+// Note: PDF and DOCX are in this list but handled separately via DocumentParser
+const SKIP_EXTENSIONS = new Set([
+  // Images
+  '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg', '.webp', '.tiff', '.tif',
+  // Videos
+  '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v',
+  // Audio
+  '.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac', '.wma',
+  // Archives
+  '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz', '.tgz',
+  // Executables and binaries
+  '.exe', '.dll', '.so', '.dylib', '.bin', '.dat', '.app',
+  // Compiled/bytecode
+  '.pyc', '.pyo', '.class', '.o', '.obj', '.wasm',
+  // Documents (binary formats) - PDF/DOCX supported via DocumentParser
+  '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods', '.odp',
+  // Fonts
+  '.ttf', '.otf', '.woff', '.woff2', '.eot',
+  // Database files
+  '.db', '.sqlite', '.sqlite3', '.mdb',
+  // IDE/Editor files
+  '.swp', '.swo', '.DS_Store', '.idea',
+  // Lock files (often auto-generated)
+  '.lock',
+  // Other binary formats
+  '.pkl', '.pickle', '.parquet', '.avro', '.protobuf', '.pb',
+  // Sensitive file extensions (Industry Standard Security)
+  '.pem', '.key', '.p12', '.pfx', '.cer', '.crt', '.der', // Certificates & Private Keys
+  '.keystore', '.jks', '.bks', // Java keystores
+  '.ppk', '.pub', // SSH keys
+  '.credentials', '.secret', // Credential files
+  '.log' // Logs (may contain sensitive data)
+]);
+
+// Files without extension that are likely binary or auto-generated
+const BINARY_FILE_NAMES = new Set([
+  'package-lock.json', // Too large and auto-generated
+  'yarn.lock',         // Too large and auto-generated
+  'pnpm-lock.yaml',    // Too large and auto-generated
+  '.DS_Store',
+  'Thumbs.db',
+  'desktop.ini'
+]);
+
+// Sensitive file names, used when MIMIR_SENSITIVE_FILES is not set
+const DEFAULT_SENSITIVE_FILE_NAMES = new Set([
+  '.env', '.env.local', '.env.development', '.env.production', '.env.test', '.env.staging', '.env.example', // Environment files
+  '.npmrc', '.yarnrc', '.pypirc', // Package manager configs with tokens
+  '.netrc', '_netrc', // FTP/HTTP credentials
+  'id_rsa', 'id_dsa', 'id_ecdsa', 'id_ed25519', // SSH private keys
+  'credentials', 'secrets.yml', 'secrets.yaml', 'secrets.json',
+  'master.key', 'production.key' // Rails secrets
+]);
+
+// Substrings that mark a file name as sensitive - one case-insensitive
+// alternation, so each name is scanned once instead of once per substring
+const SENSITIVE_NAME_PATTERN = /password|passwd|secret|credential|token|apikey|api_key|private_key/i;
+
+interface SensitiveFileRules {
+  names: ReadonlySet<string>;
+  glob: RegExp | null;   // All wildcard entries (e.g. "*.po") as one anchored alternation
+}
+
+// MIMIR_SENSITIVE_FILES parsed once per distinct value rather than per file
+let sensitiveFileRules: { source: string | undefined; rules: SensitiveFileRules } | null = null;
+
+function getSensitiveFileRules(): SensitiveFileRules {
+  const source = process.env.MIMIR_SENSITIVE_FILES;
+  if (sensitiveFileRules && sensitiveFileRules.source === source) {
+    return sensitiveFileRules.rules;
+  }
+
+  let rules: SensitiveFileRules = { names: DEFAULT_SENSITIVE_FILE_NAMES, glob: null };
+  if (source) {
+    const entries = source.split(',').map(f => f.trim()).filter(f => f.length > 0);
+    const globs = entries
+      .filter(entry => entry.includes('*'))
+      .map(entry => entry.replace(/[.+?^${}()|[\]\\]/g, '\\$&').replace(/\*/g, '.*'));
+    rules = {
+      names: new Set(entries),
+      glob: globs.length > 0 ? new RegExp(`^(?:${globs.join('|')})$`) : null
+    };
+  }
+  sensitiveFileRules = { source, rules };
+  return rules;
+}
+
+// Same result as content.split('\n').length without building an array of every line
+function countLines(content: string): number {
+  let lines = 1;
+  for (let i = content.indexOf('\n'); i !== -1; i = content.indexOf('\n', i + 1)) {
+    lines++;
+  }
+  return lines;
+}
+
+// detectLanguage lookup - extension (lowercase, with dot) to language name
+const LANGUAGE_BY_EXTENSION: ReadonlyMap<string, string> = new Map([
+  ['.ts', 'typescript'],
+  ['.tsx', 'typescript'],
+  ['.js', 'javascript'],
+  ['.jsx', 'javascript'],
+  ['.py', 'python'],
+  ['.java', 'java'],
+  ['.go', 'go'],
+  ['.rs', 'rust'],
+  ['.cpp', 'cpp'],
+  ['.c', 'c'],
+  ['.cs', 'csharp'],
+  ['.rb', 'ruby'],
+  ['.php', 'php'],
+  ['.md', 'markdown'],
+  ['.json', 'json'],
+  ['.yaml', 'yaml'],
+  ['.yml', 'yaml'],
+  ['.xml', 'xml'],
+  ['.html', 'html'],
+  ['.css', 'css'],
+  ['.scss', 'scss'],
+  ['.sql', 'sql']
+]);
+
 /**
  * Generate a deterministic hash-based ID for content
  * This ensures idempotent re-indexing without duplicate creation issues
@@ -355,7 +480,7 @@ export class FileIndexer {
               storedMtime === mtimeStr &&
               (hasEmbedding || chunkCount > 0)) {
             const hostPath = this.translateToHostPath(filePath);
-            console.log(`⚡ Fast skip: ${hostPath || filePath}`);
+            debugLog(`⚡ Fast skip: ${hostPath || filePath}`);
             return {
               file_node_id: 'cached',
               path: relativePath,
@@ -371,9 +496,15 @@ export class FileIndexer {
       if (binaryDoc) {
         const buffer = await fs.readFile(filePath);
         content = await this.documentParser.extractText(buffer, extension);
-        console.log(`📄 Extracted ${content.length} chars from ${extension} document: ${relativePath}`);
+        debugLog(`📄 Extracted ${content.length} chars from ${extension} document: ${relativePath}`);
       } else if (!this.shouldSkipFile(filePath, extension)) {
-        content = await fs.readFile(filePath, 'utf-8');
+        // Null-byte check on the raw bytes first so binaries are never decoded -
+        // UTF-8 only yields U+0000 from a 0x00 byte, so this matches the string check
+        const buffer = await fs.readFile(filePath);
+        if (buffer.includes(0)) {
+          throw new Error('Binary content detected');
+        }
+        content = buffer.toString('utf-8');
         if (!this.isTextContent(content)) {
           throw new Error('Binary content detected');
         }
@@ -402,7 +533,7 @@ export class FileIndexer {
 
           // Re-generate if content changed (hash mismatch)
           if (hasExistingEmbeddings && existingHash && existingHash !== contentHash) {
-            console.log(`📝 File content changed, regenerating embeddings: ${relativePath}`);
+            debugLog(`📝 File content changed, regenerating embeddings: ${relativePath}`);
             hasExistingEmbeddings = false;
 
             if (chunkCount > 0) {
@@ -492,7 +623,7 @@ export class FileIndexer {
           extension: extension,
           language: language,
           size_bytes: stats.size,
-          line_count: content.split('\n').length,
+          line_count: countLines(content),
           last_modified: stats.mtime.toISOString(),
           content_hash: contentHash,
           has_chunks: needsChunking,
@@ -546,7 +677,6 @@ export class FileIndexer {
                       c.text = $text,
                       c.start_offset = $startOffset,
                       c.end_offset = $endOffset,
-                      c.embedding = $embedding,
                       c.embedding_dimensions = $dimensions,
                       c.embedding_model = $model,
                       c.type = 'file_chunk',
@@ -558,6 +688,8 @@ export class FileIndexer {
                       c.has_next = $hasNext,
                       c.has_prev = $hasPrev
                   MERGE (f)-[:HAS_CHUNK {index: $chunkIndex}]->(c)
+                  WITH c
+                  CALL db.create.setNodeVectorProperty(c, 'embedding', $embedding)
                 `, {
                   fileNodeId,
                   chunkId,
@@ -577,7 +709,7 @@ export class FileIndexer {
                 chunksCreated++;
               }
               
-              console.log(`✅ Created ${chunksCreated} chunk embeddings for ${displayPath}`);
+              debugLog(`✅ Created ${chunksCreated} chunk embeddings for ${displayPath}`);
             } else {
               // Small file: Store embedding directly on File node with metadata enrichment
               const enrichedContent = metadataPrefix + content;
@@ -585,8 +717,8 @@ export class FileIndexer {
 
               await session.run(`
                 MATCH (f:File) WHERE id(f) = $fileNodeId
+                CALL db.create.setNodeVectorProperty(f, 'embedding', $embedding)
                 SET
-                  f.embedding = $embedding,
                   f.embedding_dimensions = $dimensions,
                   f.embedding_model = $model,
                   f.has_embedding = true
@@ -597,16 +729,20 @@ export class FileIndexer {
                 model: embedding.model
               });
 
-              console.log(`✅ Created file embedding for ${displayPath}`);
+              debugLog(`✅ Created file embedding for ${displayPath}`);
             }
           } catch (error: any) {
             console.warn(`⚠️  Failed to generate embeddings for ${displayPath}: ${error.message}`);
           }
         }
       } else if (generateEmbeddings && hasExistingChunks) {
-        console.log(`⏭️  Skipping embeddings (already exist): ${displayPath}`);
+        debugLog(`⏭️  Skipping embeddings (already exist): ${displayPath}`);
       }
 
+      // The file node (and possibly its chunks) changed - fast skips above
+      // return before this, so a polling rescan keeps the search cache
+      invalidateSearchCache();
+
       return {
         file_node_id: `file-${fileNodeId}`,
         path: relativePath,
@@ -706,110 +842,27 @@ export class FileIndexer {
    * Note: PDF and DOCX are in this list but handled separately via DocumentParser
    */
   private shouldSkipFile(filePath: string, extension: string): boolean {
-    // Binary and non-text file extensions to skip
-    const skipExtensions = new Set([
-      // Images
-      '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg', '.webp', '.tiff', '.tif',
-      // Videos
-      '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v',
-      // Audio
-      '.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac', '.wma',
-      // Archives
-      '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz', '.tgz',
-      // Executables and binaries
-      '.exe', '.dll', '.so', '.dylib', '.bin', '.dat', '.app',
-      // Compiled/bytecode
-      '.pyc', '.pyo', '.class', '.o', '.obj', '.wasm',
-      // Documents (binary formats) - PDF/DOCX supported via DocumentParser
-      '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods', '.odp',
-      // Fonts
-      '.ttf', '.otf', '.woff', '.woff2', '.eot',
-      // Database files
-      '.db', '.sqlite', '.sqlite3', '.mdb',
-      // IDE/Editor files
-      '.swp', '.swo', '.DS_Store', '.idea',
-      // Lock files (often auto-generated)
-      '.lock',
-      // Other binary formats
-      '.pkl', '.pickle', '.parquet', '.avro', '.protobuf', '.pb',
-      // Sensitive file extensions (Industry Standard Security)
-      '.pem', '.key', '.p12', '.pfx', '.cer', '.crt', '.der', // Certificates & Private Keys
-      '.keystore', '.jks', '.bks', // Java keystores
-      '.ppk', '.pub', // SSH keys
-      '.credentials', '.secret', // Credential files
-      '.log' // Logs (may contain sensitive data)
-    ]);
-    
     // Check extension
-    if (skipExtensions.has(extension)) {
+    if (SKIP_EXTENSIONS.has(extension)) {
       return true;
     }
     
     // Skip files without extension that are likely binary or auto-generated
     const fileName = path.basename(filePath);
-    const binaryFileNames = new Set([
-      'package-lock.json', // Too large and auto-generated
-      'yarn.lock',         // Too large and auto-generated
-      'pnpm-lock.yaml',    // Too large and auto-generated
-      '.DS_Store',
-      'Thumbs.db',
-      'desktop.ini'
-    ]);
-    
-    if (binaryFileNames.has(fileName)) {
+    if (BINARY_FILE_NAMES.has(fileName)) {
       return true;
     }
     
     // Skip sensitive files by name (Industry Standard Security)
-    // Configurable via MIMIR_SENSITIVE_FILES environment variable (comma-separated)
-    const defaultSensitiveFiles = [
-      '.env', '.env.local', '.env.development', '.env.production', '.env.test', '.env.staging', '.env.example', // Environment files
-      '.npmrc', '.yarnrc', '.pypirc', // Package manager configs with tokens
-      '.netrc', '_netrc', // FTP/HTTP credentials
-      'id_rsa', 'id_dsa', 'id_ecdsa', 'id_ed25519', // SSH private keys
-      'credentials', 'secrets.yml', 'secrets.yaml', 'secrets.json',
-      'master.key', 'production.key' // Rails secrets
-    ];
-    
-    const sensitiveFileNames = new Set(
-      process.env.MIMIR_SENSITIVE_FILES
-        ? process.env.MIMIR_SENSITIVE_FILES.split(',').map(f => f.trim()).filter(f => f.length > 0)
-        : defaultSensitiveFiles
-    );
-
-    if (sensitiveFileNames.has(fileName)) {
+    // Configurable via MIMIR_SENSITIVE_FILES environment variable (comma-separated,
+    // wildcard patterns such as "*.po" allowed)
+    const sensitiveRules = getSensitiveFileRules();
+    if (sensitiveRules.names.has(fileName) || sensitiveRules.glob?.test(fileName)) {
       return true;
     }
-
-    // Check for wildcard patterns in MIMIR_SENSITIVE_FILES (e.g., "*.po")
-    if (process.env.MIMIR_SENSITIVE_FILES) {
-      for (const pattern of process.env.MIMIR_SENSITIVE_FILES.split(',').map(p => p.trim())) {
-        if (pattern.includes('*')) {
-          // Convert glob pattern to regex
-          const regexPattern = pattern
-            .replace(/\./g, '\\.')  // Escape dots
-            .replace(/\*/g, '.*');   // Convert * to .*
-          const regex = new RegExp(`^${regexPattern}$`);
-          if (regex.test(fileName)) {
-            return true;
-          }
-        }
-      }
-    }
     
     // Skip files with sensitive patterns in name
-    const lowerFileName = fileName.toLowerCase();
-    const sensitivePatterns = [
-      'password', 'passwd', 'secret', 'credential', 'token', 'apikey', 'api_key', 'private_key'
-    ];
-    
-    for (const pattern of sensitivePatterns) {
-      if (lowerFileName.includes(pattern)) {
-        return true;
-      }
-    }
-    
-    return false;
+    return SENSITIVE_NAME_PATTERN.test(fileName);
   }
 
   /**
@@ -817,31 +870,7 @@ export class FileIndexer {
    */
   private detectLanguage(filePath: string): string {
     const ext = path.extname(filePath).toLowerCase();
-    const languageMap: Record<string, string> = {
-      '.ts': 'typescript',
-      '.tsx': 'typescript',
-      '.js': 'javascript',
-      '.jsx': 'javascript',
-      '.py': 'python',
-      '.java': 'java',
-      '.go': 'go',
-      '.rs': 'rust',
-      '.cpp': 'cpp',
-      '.c': 'c',
-      '.cs': 'csharp',
-      '.rb': 'ruby',
-      '.php': 'php',
-      '.md': 'markdown',
-      '.json': 'json',
-      '.yaml': 'yaml',
-      '.yml': 'yaml',
-      '.xml': 'xml',
-      '.html': 'html',
-      '.css': 'css',
-      '.scss': 'scss',
-      '.sql': 'sql'
-    };
-    return languageMap[ext] || 'generic';
+    return LANGUAGE_BY_EXTENSION.get(ext) || 'generic';
   }
 
   /**
@@ -882,7 +911,7 @@ export class FileIndexer {
         OPTIONAL MATCH (f)-[:HAS_CHUNK]->(c:FileChunk)
         DETACH DELETE f, c
       `, { path: relativePath });
-      
+      invalidateSearchCache();
     } finally {
       await session.close();
     }
@@ -10,6 +10,19 @@ import { WatchConfig } from '../types/index.js';
 import { GitignoreHandler } from './GitignoreHandler.js';
 import { FileIndexer } from './FileIndexer.js';
 import { WatchConfigManager } from './WatchConfigManager.js';
+import { debugLog } from '../utils/logger.js';
+import { translateHostToContainer } from '../utils/path-utils.js';
+
+// Errors worth retrying (file not fully written yet), as one case-insensitive
+// alternation compiled at load - a single scan of the message per check
+const RETRYABLE_ERROR_PATTERN = new RegExp([
+  'empty',
+  'Invalid PDF structure',
+  'invalid structure',
+  'size is zero',
+  'EBUSY',  // File locked
+  'EAGAIN', // Resource temporarily unavailable
+].join('|'), 'i');
 
 interface IndexingProgress {
   path: string;
@@ -34,6 +47,8 @@ export class FileWatchManager {
   private progressTrackers: Map<string, IndexingProgress> = new Map();
   private indexingPromises: Map<string, Promise<void>> = new Map();
   private progressCallbacks: Array<(progress: IndexingProgress) => void> = [];
+  private pendingProgress: Map<string, IndexingProgress> = new Map(); // Latest undelivered update per path
+  private progressFlushScheduled = false;
   private activeIndexingPaths: Set<string> = new Set(); // Track active indexing jobs to prevent duplicates
 
   constructor(private driver: Driver) {
@@ -172,8 +187,40 @@ export class FileWatchManager {
   
   /**
    * Emit progress update to all registered callbacks
+   *
+   * Intermediate updates are queued and delivered on the next event-loop turn,
+   * so the indexing tasks never wait on listeners (SSE writes, one per client).
+   * Updates for the same path coalesce to the latest state. Terminal states
+   * (completed/cancelled/error) are delivered immediately so clients always
+   * see the job finish.
    */
   private emitProgress(progress: IndexingProgress): void {
+    if (progress.status === 'queued' || progress.status === 'indexing') {
+      this.pendingProgress.set(progress.path, progress);
+      if (!this.progressFlushScheduled) {
+        this.progressFlushScheduled = true;
+        setImmediate(() => this.flushProgress());
+      }
+      return;
+    }
+
+    this.pendingProgress.delete(progress.path);
+    this.deliverProgress(progress);
+  }
+
+  /**
+   * Deliver all queued progress updates
+   */
+  private flushProgress(): void {
+    this.progressFlushScheduled = false;
+    const pending = [...this.pendingProgress.values()];
+    this.pendingProgress.clear();
+    for (const progress of pending) {
+      this.deliverProgress(progress);
+    }
+  }
+
+  private deliverProgress(progress: IndexingProgress): void {
     // console.log(`[FileWatchManager] Emitting progress for ${progress.path} to ${this.progressCallbacks.length} callbacks`);
     for (const callback of this.progressCallbacks) {
       try {
@@ -348,7 +395,6 @@ export class FileWatchManager {
     }
 
     // Translate host path to container path for file operations
-    const { translateHostToContainer } = await import('../utils/path-utils.js');
     const containerPath = translateHostToContainer(config.path);
 
     // Load gitignore for file counting
@@ -714,7 +760,6 @@ export class FileWatchManager {
    */
   async indexFolder(folderPath: string, config: WatchConfig, signal?: AbortSignal): Promise<number> {
     // Translate host path to container path for file operations
-    const { translateHostToContainer } = await import('../utils/path-utils.js');
     const containerPath = translateHostToContainer(folderPath);
     console.log(`📂 Indexing folder: ${folderPath} (container: ${containerPath})`);
 
@@ -762,7 +807,7 @@ export class FileWatchManager {
       const result = await this.indexer.checkFastSkip(file);
       if (result.skip) {
         fastSkipped++;
-        console.log(`⚡ Fast skip: ${file}`);
+        debugLog(`⚡ Fast skip: ${file}`);
       } else {
         filesToIndex.push(file);
       }
@@ -870,17 +915,7 @@ export class FileWatchManager {
    * Check if error is retryable (file not fully written yet)
    */
   private isRetryableError(errorMessage: string): boolean {
-    const retryablePatterns = [
-      'empty',
-      'Invalid PDF structure',
-      'invalid structure',
-      'size is zero',
-      'EBUSY',  // File locked
-      'EAGAIN', // Resource temporarily unavailable
-    ];
-    return retryablePatterns.some(pattern =>
-      errorMessage.toLowerCase().includes(pattern.toLowerCase())
-    );
+    return RETRYABLE_ERROR_PATTERN.test(errorMessage);
   }
 
   /**
@@ -3,7 +3,7 @@
  * @description Core graph database manager for Neo4j operations
  */
 
-import neo4j, { Driver } from 'neo4j-driver';
+import neo4j, { Driver, Result } from 'neo4j-driver';
 import type {
   IGraphManager,
   Node,
@@ -16,10 +16,43 @@ import type {
   Subgraph,
   ClearType
 } from '../types/index.js';
-import { EmbeddingsService } from '../indexing/EmbeddingsService.js';
-import { UnifiedSearchService } from './UnifiedSearchService.js';
+import { EmbeddingsService, type EmbeddingResult } from '../indexing/EmbeddingsService.js';
+import { UnifiedSearchService, invalidateSearchCache } from './UnifiedSearchService.js';
 import { flattenForMCP } from '../tools/mcp/flattenForMCP.js';
 import { getEmbeddingsConfig } from '../config/embeddings-config.js';
+import { debugLog } from '../utils/logger.js';
+import { hasText } from '../utils/text.js';
+
+// Bolt connection pool shared by every session on this driver
+const getMaxConnectionPoolSize = () => parseInt(process.env.NEO4J_MAX_CONNECTION_POOL_SIZE || '50', 10);
+// How long a session waits for a free pooled connection before failing
+const getConnectionAcquisitionTimeoutMs = () => parseInt(process.env.NEO4J_CONNECTION_ACQUISITION_TIMEOUT_MS || '60000', 10);
+
+// Properties left out of the catch-all section of a node's embedding text
+// (system fields, plus the priority fields that are already emitted first)
+const EMBEDDING_TEXT_SKIP_FIELDS = new Set([
+  'id', 'type', 'created', 'updated', 'title', 'name', 'description', 'content',
+  'embedding', 'embedding_dimensions', 'embedding_model', 'has_embedding'
+]);
+
+// Upper bound for graph traversal depth (each hop multiplies the frontier)
+const MAX_TRAVERSAL_DEPTH = 5;
+
+/**
+ * Coerce a caller-supplied depth to an integer in 1..MAX_TRAVERSAL_DEPTH
+ *
+ * Cypher cannot take variable-length bounds as parameters, so the depth is
+ * interpolated into the query text - never let a raw value reach it.
+ *
+ * @example
+ * toTraversalDepth('3', 1); // 3
+ * toTraversalDepth(99, 1);  // 5
+ */
+function toTraversalDepth(depth: unknown, fallback: number): number {
+  const value = Math.floor(Number(depth));
+  if (!Number.isFinite(value)) return fallback;
+  return Math.max(1, Math.min(MAX_TRAVERSAL_DEPTH, value));
+}
 
 /**
  * GraphManager - Core interface to Neo4j graph database
@@ -71,6 +104,7 @@ export class GraphManager implements IGraphManager {
   private nodeCounter = 0;
   private edgeCounter = 0;
   private embeddingsService: EmbeddingsService | null = null;
+  private apocPathAvailable = true;
   private unifiedSearchService: UnifiedSearchService;
 
   constructor(uri: string, user: string, password: string) {
@@ -78,8 +112,8 @@ export class GraphManager implements IGraphManager {
       uri,
       neo4j.auth.basic(user, password),
       {
-        maxConnectionPoolSize: 50,
-        connectionAcquisitionTimeout: 60000,
+        maxConnectionPoolSize: getMaxConnectionPoolSize(),
+        connectionAcquisitionTimeout: getConnectionAcquisitionTimeoutMs(),
         connectionTimeout: 30000
       }
     );
@@ -193,10 +227,17 @@ export class GraphManager implements IGraphManager {
         FOR (n:Node) REQUIRE n.id IS UNIQUE
       `);
 
-      // Full-text search index
+      // Full-text search index (BM25) over the text fields nodes actually carry.
+      // The old node_search index covered a non-existent n.properties field.
+      try {
+        await session.run(`DROP INDEX node_search IF EXISTS`);
+      } catch (error) {
+        // Ignore if index doesn't exist
+      }
+
       await session.run(`
-        CREATE FULLTEXT INDEX node_search IF NOT EXISTS
-        FOR (n:Node) ON EACH [n.properties]
+        CREATE FULLTEXT INDEX node_content_search IF NOT EXISTS
+        FOR (n:Node) ON EACH [n.title, n.name, n.description, n.content, n.text, n.path]
       `);
 
       // Type index for fast filtering
@@ -253,6 +294,9 @@ export class GraphManager implements IGraphManager {
       
       console.log(`🔧 Creating vector index with ${dimensions} dimensions`);
       
+      // Embeddings are unit length and written with db.create.setNodeVectorProperty
+      // (stored as float32, half the size of a plain float64 list), so the index's
+      // cosine reduces to a dot product
       await session.run(`
         CREATE VECTOR INDEX node_embedding_index IF NOT EXISTS
         FOR (n:Node) ON (n.embedding)
@@ -262,6 +306,53 @@ export class GraphManager implements IGraphManager {
         }}
       `);
 
+      // IF NOT EXISTS keeps an index created with other dimensions - queryNodes
+      // then fails for every search, so surface the mismatch at startup
+      try {
+        const indexResult = await session.run(`
+          SHOW VECTOR INDEXES YIELD name, options
+          WHERE name = 'node_embedding_index'
+          RETURN options.indexConfig['vector.dimensions'] AS dimensions
+        `);
+        const existingDimensions = indexResult.records[0]?.get('dimensions');
+        const existing = typeof existingDimensions?.toNumber === 'function'
+          ? existingDimensions.toNumber()
+          : existingDimensions;
+        if (existing && existing !== dimensions) {
+          console.warn(`⚠️  node_embedding_index has ${existing} dimensions but MIMIR_EMBEDDINGS_DIMENSIONS=${dimensions}`);
+          console.warn('⚠️  Run: DROP INDEX node_embedding_index (it is recreated on next start)');
+        }
+      } catch (error) {
+        // SHOW VECTOR INDEXES unavailable on older servers - skip the check
+      }
+
+      // Migration (opt-in, one-shot): rewrite embeddings stored before vectors
+      // were unit-length float32 properties. Every vector is rewritten, not just
+      // the off-norm ones - a provider-normalized embedding saved as a plain
+      // list is still a float64 array taking twice the space in the store
+      if (process.env.MIMIR_MIGRATE_NORMALIZE_EMBEDDINGS === 'true') {
+        console.log('🔧 Normalizing stored embeddings to unit-length float32...');
+        // apoc.coll.sum runs the summation in Java; fall back to a Cypher
+        // reduce() when APOC is not installed
+        const normalizeQuery = (sumOfSquares: string) => `
+          MATCH (n:Node)
+          WHERE n.embedding IS NOT NULL
+          CALL {
+            WITH n
+            WITH n, sqrt(${sumOfSquares}) AS norm
+            WHERE norm > 0
+            CALL db.create.setNodeVectorProperty(n, 'embedding', [x IN n.embedding | x / norm])
+          } IN TRANSACTIONS OF 1000 ROWS
+        `;
+        try {
+          await session.run(normalizeQuery('apoc.coll.sum([x IN n.embedding | x * x])'));
+        } catch (error: any) {
+          if (!String(error.message).includes('apoc.coll.sum')) throw error;
+          await session.run(normalizeQuery('reduce(s = 0.0, x IN n.embedding | s + x * x)'));
+        }
+        console.log('✅ Stored embeddings normalized (unset MIMIR_MIGRATE_NORMALIZE_EMBEDDINGS)');
+      }
+
       // Migration: Add Node label to existing File nodes and set type property
       await session.run(`
         MATCH (f:File)
@@ -319,12 +410,9 @@ export class GraphManager implements IGraphManager {
     }
     
     // Now include ALL other properties (stringified)
-    const systemFields = new Set(['id', 'type', 'created', 'updated', 'title', 'name', 'description', 'content', 
-                                   'embedding', 'embedding_dimensions', 'embedding_model', 'has_embedding']);
-    
     for (const [key, value] of Object.entries(properties)) {
       // Skip system fields and already-included fields
-      if (systemFields.has(key)) {
+      if (EMBEDDING_TEXT_SKIP_FIELDS.has(key)) {
         continue;
       }
       
@@ -351,7 +439,7 @@ export class GraphManager implements IGraphManager {
         stringValue = String(value);
       }
       
-      if (stringValue.trim().length > 0) {
+      if (hasText(stringValue)) {
         parts.push(`${key}: ${stringValue}`);
       }
     }
@@ -375,7 +463,7 @@ export class GraphManager implements IGraphManager {
       return null;
     }
     
-    console.log(`📦 Creating chunks for node ${nodeId} (${textContent.length} chars)...`);
+    debugLog(`📦 Creating chunks for node ${nodeId} (${textContent.length} chars)...`);
     
     try {
       // Generate chunk embeddings
@@ -394,7 +482,6 @@ export class GraphManager implements IGraphManager {
             c.text = $text,
             c.start_offset = $startOffset,
             c.end_offset = $endOffset,
-            c.embedding = $embedding,
             c.embedding_dimensions = $dimensions,
             c.embedding_model = $model,
             c.type = 'node_chunk',
@@ -406,11 +493,12 @@ export class GraphManager implements IGraphManager {
             c.text = $text,
             c.start_offset = $startOffset,
             c.end_offset = $endOffset,
-            c.embedding = $embedding,
             c.embedding_dimensions = $dimensions,
             c.embedding_model = $model,
             c.indexed_date = datetime()
           MERGE (n)-[:HAS_CHUNK {index: $chunkIndex}]->(c)
+          WITH c
+          CALL db.create.setNodeVectorProperty(c, 'embedding', $embedding)
           RETURN c.id AS chunk_id
           `,
           {
@@ -427,7 +515,7 @@ export class GraphManager implements IGraphManager {
         );
       }
       
-      console.log(`✅ Created ${chunks.length} chunks for node ${nodeId}`);
+      debugLog(`✅ Created ${chunks.length} chunks for node ${nodeId}`);
       return { chunkCount: chunks.length, totalChars: textContent.length };
     } catch (error: any) {
       console.error(`⚠️  Failed to create chunks for node ${nodeId}: ${error.message}`);
@@ -534,68 +622,80 @@ export class GraphManager implements IGraphManager {
         has_embedding: false  // Will be updated after embedding generation
       };
 
-      // Create the node first
-      const createResult = await session.run(
-        'CREATE (n:Node $props) RETURN n { .*, embedding: null }',
-        { props: nodeProps }
-      );
-
       // Generate embeddings if enabled and not already provided
       const hasExistingEmbedding = actualProperties.embedding || actualProperties.has_embedding === true;
-      
+      let textContent: string | null = null;
+      let pendingEmbedding: Promise<EmbeddingResult> | null = null;
+      const chunkSize = parseInt(process.env.MIMIR_EMBEDDINGS_CHUNK_SIZE || '768', 10);
+
       if (this.embeddingsService && !hasExistingEmbedding) {
         // Ensure embeddings service is initialized
         if (!this.embeddingsService.isEnabled()) {
           await this.embeddingsService.initialize();
         }
-        
+
         if (this.embeddingsService.isEnabled()) {
           // Extract text content for embedding generation
-          const textContent = this.extractTextContent(actualProperties);
-          
-          if (textContent && textContent.trim().length > 0) {
-            const chunkSize = parseInt(process.env.MIMIR_EMBEDDINGS_CHUNK_SIZE || '768', 10);
+          textContent = this.extractTextContent(actualProperties);
+
+          // Single-embedding nodes: request the vector now so the provider
+          // call overlaps the CREATE round trip instead of following it
+          if (hasText(textContent) && textContent.length <= chunkSize) {
+            pendingEmbedding = this.embeddingsService.generateEmbedding(textContent);
+            // Failures are reported where it is awaited below; don't let a
+            // failed CREATE leave the rejection unhandled
+            pendingEmbedding.catch(() => {});
+          }
+        }
+      }
+
+      // Create the node first
+      const createResult = await session.run(
+        'CREATE (n:Node $props) RETURN n { .*, embedding: null }',
+        { props: nodeProps }
+      );
+
+      if (hasText(textContent)) {
+        try {
+          // Check if content needs chunking
+          if (textContent.length > chunkSize) {
+            // Large content - use chunking
+            debugLog(`📦 Node ${id} has large content (${textContent.length} chars), creating chunks...`);
+            await this.createNodeChunks(id, textContent, session);
             
-            try {
-              // Check if content needs chunking
-              if (textContent.length > chunkSize) {
-                // Large content - use chunking
-                console.log(`📦 Node ${id} has large content (${textContent.length} chars), creating chunks...`);
-                await this.createNodeChunks(id, textContent, session);
-                
-                // Update node to mark it has chunks (no single embedding on parent node)
-                await session.run(
-                  `MATCH (n:Node {id: $id}) SET n.has_embedding = true, n.has_chunks = true`,
-                  { id }
-                );
-              } else {
-                // Small content - single embedding
-                const result = await this.embeddingsService.generateEmbedding(textContent);
-                await session.run(
-                  `MATCH (n:Node {id: $id}) 
-                   SET n.embedding = $embedding,
-                       n.embedding_dimensions = $dimensions,
-                       n.embedding_model = $model,
-                       n.has_embedding = true`,
-                  {
-                    id,
-                    embedding: result.embedding,
-                    dimensions: result.dimensions,
-                    model: result.model
-                  }
-                );
-                console.log(`✅ Generated single embedding for ${actualType} node: ${id} (${result.dimensions} dimensions)`);
+            // Update node to mark it has chunks (no single embedding on parent node)
+            await session.run(
+              `MATCH (n:Node {id: $id}) SET n.has_embedding = true, n.has_chunks = true`,
+              { id }
+            );
+          } else {
+            // Small content - single embedding (requested before the CREATE)
+            const result = await pendingEmbedding!;
+            await session.run(
+              `MATCH (n:Node {id: $id}) 
+               CALL db.create.setNodeVectorProperty(n, 'embedding', $embedding)
+               SET n.embedding_dimensions = $dimensions,
+                   n.embedding_model = $model,
+                   n.has_embedding = true`,
+              {
+                id,
+                embedding: result.embedding,
+                dimensions: result.dimensions,
+                model: result.model
               }
-            } catch (error: any) {
-              console.error(`⚠️  Failed to generate embedding for ${actualType} node: ${error.message}`);
-            }
+            );
+            debugLog(`✅ Generated single embedding for ${actualType} node: ${id} (${result.dimensions} dimensions)`);
           }
+        } catch (error: any) {
+          console.error(`⚠️  Failed to generate embedding for ${actualType} node: ${error.message}`);
         }
       }
 
       // Return the created node
       return this.nodeFromRecord(createResult.records[0].get('n'), undefined, false);
     } finally {
+      // Cached search responses may include what this just changed
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -755,14 +855,14 @@ export class GraphManager implements IGraphManager {
           // Extract text content for embedding generation
           const textContent = this.extractTextContent(updatedNode);
 
-          if (textContent && textContent.trim().length > 0) {
+          if (hasText(textContent)) {
             const chunkSize = parseInt(process.env.MIMIR_EMBEDDINGS_CHUNK_SIZE || '768', 10);
 
             try {
               // Check if content needs chunking
               if (textContent.length > chunkSize) {
                 // Large content - use chunking
-                console.log(`📦 Node ${id} has large content (${textContent.length} chars), regenerating chunks...`);
+                debugLog(`📦 Node ${id} has large content (${textContent.length} chars), regenerating chunks...`);
                 
                 // Delete existing chunks first
                 await session.run(
@@ -789,8 +889,8 @@ export class GraphManager implements IGraphManager {
                 // Delete existing chunks if any
                 await session.run(
                   `MATCH (n:Node {id: $id})
-                   SET n.embedding = $embedding,
-                       n.embedding_dimensions = $dimensions,
+                   CALL db.create.setNodeVectorProperty(n, 'embedding', $embedding)
+                   SET n.embedding_dimensions = $dimensions,
                        n.embedding_model = $model,
                        n.has_embedding = true,
                        n.has_chunks = false
@@ -804,7 +904,7 @@ export class GraphManager implements IGraphManager {
                     model: embeddingResult.model
                   }
                 );
-                console.log(`✅ Regenerated embedding for node ${id} (${embeddingResult.dimensions} dimensions)`);
+                debugLog(`✅ Regenerated embedding for node ${id} (${embeddingResult.dimensions} dimensions)`);
               }
             } catch (error: any) {
               console.error(`⚠️  Failed to regenerate embedding for node ${id}: ${error.message}`);
@@ -816,6 +916,7 @@ export class GraphManager implements IGraphManager {
       // Single node operation - return full content (don't strip)
       return this.nodeFromRecord(result.records[0].get('n'), undefined, false);
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -835,6 +936,7 @@ export class GraphManager implements IGraphManager {
       const deleted = result.records[0]?.get('deleted').toNumber() || 0;
       return deleted > 0;
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -893,6 +995,7 @@ export class GraphManager implements IGraphManager {
 
       return this.edgeFromRecord(result.records[0].get('e'), source, target);
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -912,6 +1015,7 @@ export class GraphManager implements IGraphManager {
       const deleted = result.records[0]?.get('deleted').toNumber() || 0;
       return deleted > 0;
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -964,12 +1068,12 @@ export class GraphManager implements IGraphManager {
             const nodeId = preparedNodes[i].id;
             const textContent = this.extractTextContent(originalNode.properties || {});
             
-            if (textContent && textContent.trim().length > 0) {
+            if (hasText(textContent)) {
               try {
                 // Check if content needs chunking
                 if (textContent.length > chunkSize) {
                   // Large content - use chunking
-                  console.log(`📦 Bulk node ${nodeId} has large content (${textContent.length} chars), creating chunks...`);
+                  debugLog(`📦 Bulk node ${nodeId} has large content (${textContent.length} chars), creating chunks...`);
                   await this.createNodeChunks(nodeId, textContent, session);
                   
                   // Update node to mark it has chunks
@@ -982,8 +1086,8 @@ export class GraphManager implements IGraphManager {
                   const result = await this.embeddingsService.generateEmbedding(textContent);
                   await session.run(
                     `MATCH (n:Node {id: $id}) 
-                     SET n.embedding = $embedding,
-                         n.embedding_dimensions = $dimensions,
+                     CALL db.create.setNodeVectorProperty(n, 'embedding', $embedding)
+                     SET n.embedding_dimensions = $dimensions,
                          n.embedding_model = $model,
                          n.has_embedding = true`,
                     {
@@ -993,7 +1097,7 @@ export class GraphManager implements IGraphManager {
                       model: result.model
                     }
                   );
-                  console.log(`✅ Generated embedding for ${originalNode.type} node (${result.dimensions} dimensions)`);
+                  debugLog(`✅ Generated embedding for ${originalNode.type} node (${result.dimensions} dimensions)`);
                 }
               } catch (error: any) {
                 console.error(`⚠️  Failed to generate embedding for ${originalNode.type} node: ${error.message}`);
@@ -1005,6 +1109,7 @@ export class GraphManager implements IGraphManager {
 
       return createResult.records.map(r => this.nodeFromRecord(r.get('n')));
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1032,6 +1137,7 @@ export class GraphManager implements IGraphManager {
 
       return result.records.map(r => this.nodeFromRecord(r.get('n')));
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1056,6 +1162,7 @@ export class GraphManager implements IGraphManager {
         errors: []  // Neo4j handles missing nodes gracefully
       };
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1095,6 +1202,7 @@ export class GraphManager implements IGraphManager {
         this.edgeFromRecord(r.get('e'), r.get('source'), r.get('target'))
       );
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1119,6 +1227,7 @@ export class GraphManager implements IGraphManager {
         errors: []
       };
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1173,8 +1282,7 @@ export class GraphManager implements IGraphManager {
         END
       } as n`;
 
-      const result = await session.run(query, params);
-      return result.records.map(r => this.nodeFromRecord(r.get('n'), undefined, false));
+      return await this.collectNodes(session.run(query, params));
     } finally {
       await session.close();
     }
@@ -1202,7 +1310,7 @@ export class GraphManager implements IGraphManager {
       // Get full node data for the IDs returned by search
       const ids = searchResult.results.map(r => r.id);
       
-      const result = await session.run(
+      return await this.collectNodes(session.run(
         `
         MATCH (n)
         WHERE (n.id IN $ids OR n.path IN $ids)
@@ -1231,17 +1339,16 @@ export class GraphManager implements IGraphManager {
           END,
           relevantLines: CASE
             WHEN size(coalesce(n.content, '')) > 1000 AND n.content IS NOT NULL
-            THEN [line IN split(n.content, '\\n') WHERE toLower(line) CONTAINS toLower($query) | line][0..10]
+            THEN [line IN split(n.content, '\\n') WHERE toLower(line) CONTAINS $queryLower | line][0..10]
             WHEN size(coalesce(n.text, '')) > 1000 AND n.text IS NOT NULL
-            THEN [line IN split(n.text, '\\n') WHERE toLower(line) CONTAINS toLower($query) | line][0..10]
+            THEN [line IN split(n.text, '\\n') WHERE toLower(line) CONTAINS $queryLower | line][0..10]
             ELSE null
           END
         } as n
         `,
-        { ids, query }
-      );
-
-      return result.records.map(r => this.nodeFromRecord(r.get('n'), undefined, false));
+        // Lowercase the query once here rather than once per scanned line
+        { ids, queryLower: query.toLowerCase() }
+      ));
     } finally {
       await session.close();
     }
@@ -1273,13 +1380,49 @@ export class GraphManager implements IGraphManager {
   // GRAPH OPERATIONS
   // ============================================================================
 
+  /**
+   * Nodes reachable from nodeId within `depth` hops (optionally over one edge type)
+   *
+   * The depth is clamped to 1..MAX_TRAVERSAL_DEPTH (5); both the APOC and the
+   * Cypher expansion only walk through :Node nodes.
+   *
+   * @example
+   * await graphManager.getNeighbors('todo-list-1', 'contains');  // direct neighbors
+   * await graphManager.getNeighbors('project-1', undefined, 9);  // traverses 5 hops
+   */
   async getNeighbors(nodeId: string, edgeType?: EdgeType, depth: number = 1): Promise<Node[]> {
+    const maxLevel = toTraversalDepth(depth, 1);
     const session = this.driver.session();
     try {
-      const result = await session.run(
-        `
-        MATCH (start:Node {id: $nodeId})-[e:EDGE*1..${depth}]-(neighbor:Node)
+      // Without an edge type filter, let APOC expand with node-global
+      // uniqueness: each neighbor is visited once instead of once per
+      // relationship path, which keeps depth >= 2 from fanning out.
+      // The edge type lives in a property, not the relationship type, so
+      // filtered traversals stay on the Cypher pattern below.
+      let expansion: string;
+      if (!edgeType && this.apocPathAvailable) {
+        expansion = `
+        MATCH (start:Node {id: $nodeId})
+        CALL apoc.path.expandConfig(start, {
+          minLevel: 1,
+          maxLevel: $maxLevel,
+          relationshipFilter: 'EDGE',
+          labelFilter: '+Node',
+          uniqueness: 'NODE_GLOBAL'
+        })
+        YIELD path
+        WITH last(nodes(path)) AS neighbor
+        `;
+      } else {
+        // Variable-length bounds cannot be parameters; maxLevel is a clamped integer
+        expansion = `
+        MATCH (start:Node {id: $nodeId})-[e:EDGE*1..${maxLevel}]-(neighbor:Node)
         ${edgeType ? 'WHERE ALL(rel IN e WHERE rel.type = $edgeType)' : ''}
+        `;
+      }
+
+      const query = `
+        ${expansion}
         RETURN DISTINCT neighbor {
           .*, 
           embedding: null,
@@ -1299,9 +1442,20 @@ export class GraphManager implements IGraphManager {
             ELSE null 
           END
         } as neighbor
-        `,
-        { nodeId, edgeType }
-      );
+        `;
+      const params = { nodeId, edgeType, maxLevel: neo4j.int(maxLevel) };
+
+      let result;
+      try {
+        result = await session.run(query, params);
+      } catch (error: any) {
+        if (error.code !== 'Neo.ClientError.Procedure.ProcedureNotFound' || !this.apocPathAvailable) {
+          throw error;
+        }
+        // APOC missing: remember it and retry with the plain Cypher pattern
+        this.apocPathAvailable = false;
+        return this.getNeighbors(nodeId, edgeType, maxLevel);
+      }
 
       return result.records.map(r => this.nodeFromRecord(r.get('neighbor'), undefined, false));
     } finally {
@@ -1310,11 +1464,13 @@ export class GraphManager implements IGraphManager {
   }
 
   async getSubgraph(nodeId: string, depth: number = 2): Promise<Subgraph> {
+    // Variable-length bounds cannot be parameters; interpolate a clamped integer only
+    const maxLevel = toTraversalDepth(depth, 2);
     const session = this.driver.session();
     try {
       const result = await session.run(
         `
-        MATCH path = (start:Node {id: $nodeId})-[e:EDGE*0..${depth}]-(connected:Node)
+        MATCH path = (start:Node {id: $nodeId})-[e:EDGE*0..${maxLevel}]-(connected:Node)
         WITH nodes(path) as pathNodes, relationships(path) as pathEdges
         UNWIND pathNodes as node
         WITH collect(DISTINCT node {
@@ -1459,6 +1615,7 @@ export class GraphManager implements IGraphManager {
         return { deletedNodes: 0, deletedEdges: 0 };
       }
     } finally {
+      invalidateSearchCache();
       await session.close();
     }
   }
@@ -1471,6 +1628,20 @@ export class GraphManager implements IGraphManager {
   // PRIVATE HELPERS
   // ============================================================================
 
+  /**
+   * Convert node records (column `n`) as they stream in from Bolt
+   *
+   * Each record is converted while later ones are still arriving, instead
+   * of buffering the full records array before mapping it.
+   */
+  private async collectNodes(result: Result): Promise<Node[]> {
+    const nodes: Node[] = [];
+    for await (const record of result) {
+      nodes.push(this.nodeFromRecord(record.get('n'), undefined, false));
+    }
+    return nodes;
+  }
+
   /**
    * Convert Neo4j record to Node object
    * Content stripping is now handled at the Neo4j query level for efficiency
@@ -1646,8 +1817,7 @@ export class GraphManager implements IGraphManager {
         END
       } as n`;
 
-      const result = await session.run(cypher, params);
-      return result.records.map(record => this.nodeFromRecord(record.get('n'), undefined, false));
+      return await this.collectNodes(session.run(cypher, params));
     } finally {
       await session.close();
     }
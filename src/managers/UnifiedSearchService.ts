@@ -12,11 +12,41 @@
  * - File indexing (stores full content for fallback when embeddings disabled)
  */
 
-import { Driver, Session } from 'neo4j-driver';
+import { Driver, Result } from 'neo4j-driver';
 import neo4j from 'neo4j-driver';
 import { EmbeddingsService } from '../indexing/EmbeddingsService.js';
 import { Node } from '../types/index.js';
-import { ReciprocalRankFusion, RRFResult } from '../utils/reciprocal-rank-fusion.js';
+import { ReciprocalRankFusion } from '../utils/reciprocal-rank-fusion.js';
+import { LRUCache } from '../utils/lru-cache.js';
+import { SemanticCache } from '../utils/semantic-cache.js';
+import { debugLog } from '../utils/logger.js';
+
+// HNSW candidate pool: the vector index returns the k nearest :Node embeddings
+// before type/similarity filters and per-file chunk grouping, so ask for more
+// than we return (and more still when a type filter will discard candidates)
+const getVectorCandidateMultiplier = () => parseInt(process.env.MIMIR_VECTOR_CANDIDATE_MULTIPLIER || '2', 10);
+// Lucene query syntax characters - escaped so free-text queries never fail to parse
+const LUCENE_SPECIAL_CHARS = /[+\-!(){}\[\]^"~*?:\\\/]|&&|\|\|/g;
+const WHITESPACE_RUN = /\s+/g;
+// A query needs at least one letter or digit to be worth an embedding request
+const SEARCHABLE_TERM = /[\p{L}\p{N}]/u;
+
+const getVectorMaxCandidates = () => parseInt(process.env.MIMIR_VECTOR_MAX_CANDIDATES || '1000', 10);
+
+// Search response cache (opt-in): agent loops re-issue the same query within
+// seconds, each costing an embedding plus two Neo4j queries. Module-level so
+// it is shared by every UnifiedSearchService instance. Graph and index writes
+// call invalidateSearchCache(); the TTL is a backstop for anything else.
+const getSearchCacheSize = () => parseInt(process.env.MIMIR_SEARCH_CACHE_SIZE || '0', 10);
+const getSearchCacheTtlMs = () => parseInt(process.env.MIMIR_SEARCH_CACHE_TTL_MS || '60000', 10);
+let searchCacheInstance: LRUCache<string, UnifiedSearchResponse> | null = null;
+function searchCache(): LRUCache<string, UnifiedSearchResponse> {
+  // Created on first use so values from .env (loaded after imports) apply
+  return searchCacheInstance ??= new LRUCache({
+    maxSize: getSearchCacheSize(),
+    ttlMs: getSearchCacheTtlMs()
+  });
+}
 
 export interface SearchResult {
   id: string;
@@ -72,6 +102,187 @@ export interface UnifiedSearchResponse {
   };
 }
 
+// Semantic tier of the search cache (opt-in): a rephrased query whose
+// embedding is within MIMIR_SEMANTIC_CACHE_THRESHOLD cosine of a cached
+// query reuses that response, skipping both Neo4j queries. 0 disables it
+const getSemanticCacheThreshold = () => parseFloat(process.env.MIMIR_SEMANTIC_CACHE_THRESHOLD || '0');
+let semanticCacheInstance: SemanticCache<UnifiedSearchResponse> | null = null;
+function semanticCache(): SemanticCache<UnifiedSearchResponse> {
+  return semanticCacheInstance ??= new SemanticCache({
+    maxSize: getSearchCacheSize(),
+    threshold: getSemanticCacheThreshold(),
+    ttlMs: getSearchCacheTtlMs()
+  });
+}
+
+// Bumped by invalidateSearchCache so a search that started before a write
+// does not store its (already stale) response afterwards
+let searchCacheEpoch = 0;
+
+/**
+ * Drop every cached search response after the graph or the index changed
+ *
+ * @example
+ * await session.run('MATCH (n:Node {id: $id}) DETACH DELETE n', { id });
+ * invalidateSearchCache();
+ */
+export function invalidateSearchCache(): void {
+  searchCacheEpoch++;
+  searchCacheInstance?.clear();
+  semanticCacheInstance?.clear();
+}
+
+/**
+ * Current invalidation epoch - lets derived caches (multi-hop traversals)
+ * notice an invalidateSearchCache() without importing their modules here
+ */
+export const getSearchCacheEpoch = (): number => searchCacheEpoch;
+
+/**
+ * Copy of a cached response down to each result and its parent_file
+ *
+ * Callers replace or append to `results` and rewrite paths in place
+ * (applyPathMappingToResult, per client); none of that may leak back into
+ * the cache or into another client's response.
+ */
+function copySearchResponse(response: UnifiedSearchResponse): UnifiedSearchResponse {
+  return {
+    ...response,
+    results: response.results.map(result => result.parent_file
+      ? { ...result, parent_file: { ...result.parent_file } }
+      : { ...result })
+  };
+}
+
+// Search statements are built once per filter shape at module load rather
+// than re-templated on every call: the text sent over Bolt is stable, so
+// Neo4j's query cache is keyed identically for every search of that shape.
+// Type filters are parameters ($types), never interpolated values.
+const vectorSearchCypher = (typeFilter: string) => `
+  CALL db.index.vector.queryNodes('node_embedding_index', toInteger($limit), $queryVector)
+  YIELD node, score
+  WHERE score >= $minSimilarity ${typeFilter}
+  
+  // For FileChunk nodes, get parent File information
+  OPTIONAL MATCH (node)<-[:HAS_CHUNK]-(parentFile:File)
+  
+  // Determine the grouping key (file path for chunks, node id for others)
+  WITH node, score, parentFile,
+       CASE 
+         WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL THEN parentFile.path
+         ELSE COALESCE(node.id, node.path)
+       END AS groupKey,
+       CASE 
+         WHEN node.type = 'file_chunk' THEN parentFile.path 
+         ELSE null 
+       END AS filePathForChunks
+  
+  // Order candidates first so the head of each group's collect() is its best match
+  ORDER BY score DESC
+  
+  // Aggregate by groupKey (this groups all chunks from the same file together)
+  // Only the best node is kept per group - no per-match maps to build and filter
+  WITH groupKey,
+       filePathForChunks,
+       head(collect(node)) AS node,
+       head(collect(parentFile)) AS parentFile,
+       max(score) AS similarity,
+       avg(score) AS avg_similarity,
+       // Count only file_chunk nodes in this group
+       count(CASE WHEN node.type = 'file_chunk' THEN 1 END) AS chunks_matched
+  
+  WITH groupKey,
+       node,
+       similarity,
+       parentFile,
+       avg_similarity,
+       // Only set chunks_matched for file_chunk results
+       CASE WHEN node.type = 'file_chunk' THEN chunks_matched ELSE null END AS chunks_matched
+  
+  ORDER BY similarity DESC
+  LIMIT toInteger($finalLimit)
+  
+  RETURN CASE 
+           WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
+           THEN parentFile.path 
+           ELSE COALESCE(node.id, node.path)
+         END AS id,
+         node.type AS type,
+         CASE 
+           WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
+           THEN parentFile.name 
+           ELSE COALESCE(node.title, node.name)
+         END AS title,
+         node.name AS name,
+         node.description AS description,
+         // Only the preview fallback reads content - ship 200 chars, not the whole node
+         CASE WHEN node.content IS :: STRING THEN left(node.content, 200) END AS content,
+         node.path AS path,
+         CASE 
+           WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
+           THEN parentFile.absolute_path 
+           ELSE node.absolute_path
+         END AS absolute_path,
+         node.text AS chunk_text,
+         node.chunk_index AS chunk_index,
+         node.id AS chunk_id,
+         similarity,
+         chunks_matched,
+         avg_similarity,
+         parentFile.path AS parent_file_path,
+         parentFile.absolute_path AS parent_file_absolute_path,
+         parentFile.name AS parent_file_name,
+         parentFile.language AS parent_file_language
+`;
+const VECTOR_SEARCH_CYPHER = {
+  all: vectorSearchCypher(''),
+  typed: vectorSearchCypher('AND node.type IN $types')
+};
+
+const fullTextSearchCypher = (typeFilter: string) => `
+  CALL db.index.fulltext.queryNodes('node_content_search', $query)
+  YIELD node, score
+  
+  // Filter by type if specified
+  ${typeFilter}
+  
+  // Keep only the top-k hits before the per-row parent lookup - Lucene can
+  // return thousands of matches and the rest would be discarded by LIMIT anyway
+  WITH node, score
+  ORDER BY score DESC
+  LIMIT $limit
+  
+  // For FileChunk nodes, get parent File information
+  OPTIONAL MATCH (node)<-[:HAS_CHUNK]-(parentFile:File)
+  
+  RETURN COALESCE(node.id, node.path) AS id,
+         node.type AS type,
+         COALESCE(node.title, node.name) AS title,
+         node.name AS name,
+         node.description AS description,
+         // Only the preview fallback reads content - ship 200 chars, not the whole node
+         CASE WHEN node.content IS :: STRING THEN left(node.content, 200) END AS content,
+         node.path AS path,
+         CASE 
+           WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
+           THEN parentFile.absolute_path 
+           ELSE node.absolute_path
+         END AS absolute_path,
+         node.text AS chunk_text,
+         node.chunk_index AS chunk_index,
+         parentFile.path AS parent_file_path,
+         parentFile.absolute_path AS parent_file_absolute_path,
+         parentFile.name AS parent_file_name,
+         parentFile.language AS parent_file_language,
+         score AS relevance
+  ORDER BY score DESC
+  LIMIT $limit
+`;
+const FULLTEXT_SEARCH_CYPHER = {
+  all: fullTextSearchCypher(''),
+  typed: fullTextSearchCypher('WHERE node.type IN $types')
+};
+
 export class UnifiedSearchService {
   private driver: Driver;
   private embeddingsService: EmbeddingsService;
@@ -195,8 +406,9 @@ export class UnifiedSearchService {
   async search(query: string, options: UnifiedSearchOptions = {}): Promise<UnifiedSearchResponse> {
     await this.initialize();
 
-    // Handle empty query - return empty results gracefully
-    if (!query || query.trim().length === 0) {
+    // Handle empty or punctuation-only query - return empty results without
+    // spending an embedding request and two Neo4j queries on it
+    if (!query || !SEARCHABLE_TERM.test(query)) {
       return {
         status: 'success',
         query: query || '',
@@ -208,6 +420,47 @@ export class UnifiedSearchService {
       };
     }
 
+    const cacheKey = JSON.stringify([query.trim().replace(WHITESPACE_RUN, ' '), options]);
+    const cached = searchCache().get(cacheKey);
+    if (cached) {
+      return copySearchResponse(cached);
+    }
+
+    // Semantic tier: embed first (the embedding cache hands the same vector
+    // to vectorSearch) and look for a near-identical earlier query
+    const optionsKey = JSON.stringify(options);
+    let queryEmbedding: number[] | null = null;
+    if (getSemanticCacheThreshold() > 0 && this.embeddingsService.isEnabled()) {
+      try {
+        queryEmbedding = (await this.embeddingsService.generateEmbedding(query)).embedding;
+      } catch (error) {
+        // Leave embedding failures to the search and its fallbacks
+      }
+      const similar = queryEmbedding && semanticCache().get(optionsKey, queryEmbedding);
+      if (similar) {
+        return { ...copySearchResponse(similar), query };
+      }
+    }
+
+    const epoch = searchCacheEpoch;
+    const response = await this.executeSearch(query, options);
+    // Degraded responses (a search backend failed) are not cached, nor are
+    // responses read before a write that landed while the search ran
+    if (response.status === 'success' && !response.fallback_triggered && epoch === searchCacheEpoch) {
+      searchCache().set(cacheKey, response);
+      if (queryEmbedding) {
+        semanticCache().set(optionsKey, queryEmbedding, response);
+      }
+      // Callers extend the response (e.g. multi-hop results) - hand out a copy
+      return copySearchResponse(response);
+    }
+    return response;
+  }
+
+  /**
+   * Run the search itself (uncached)
+   */
+  private async executeSearch(query: string, options: UnifiedSearchOptions): Promise<UnifiedSearchResponse> {
     // Always use RRF hybrid search if embeddings enabled
     if (this.embeddingsService.isEnabled()) {
       return await this.rrfHybridSearch(query, options);
@@ -232,25 +485,27 @@ export class UnifiedSearchService {
    * Vector similarity search
    */
   private async vectorSearch(query: string, options: UnifiedSearchOptions): Promise<SearchResult[]> {
-    const session = this.driver.session();
+    // Embed before opening a session: when the provider fails, the fallback
+    // path runs without a Bolt session ever having been opened for this search
+    const queryEmbedding = await this.embeddingsService.generateEmbedding(query);
 
-    try {
-      // Generate embedding for query
-      const queryEmbedding = await this.embeddingsService.generateEmbedding(query);
+    const session = this.driver.session({ defaultAccessMode: neo4j.session.READ });
 
+    try {
       const limit = Math.floor(options.limit || 10);
       // Default minSimilarity from env or 0.5 (0.75 was too strict)
       const defaultMinSimilarity = parseFloat(process.env.MIMIR_MIN_SIMILARITY || '0.5');
       const minSimilarity = options.minSimilarity || defaultMinSimilarity;
 
-      // Build type filter if provided
-      let typeFilter = '';
+      const hasTypeFilter = !!(options.types && Array.isArray(options.types) && options.types.length > 0);
+      const candidateMultiplier = getVectorCandidateMultiplier() * (hasTypeFilter ? 2 : 1);
       const queryParams: any = {
         queryVector: queryEmbedding.embedding,
-        limit: Math.floor(limit * 2) // Get more candidates for filtering
+        // Candidates pulled from the HNSW index (ANN search, no full scan)
+        limit: Math.min(Math.max(limit * candidateMultiplier, limit), getVectorMaxCandidates())
       };
       
-      if (options.types && Array.isArray(options.types) && options.types.length > 0) {
+      if (hasTypeFilter && options.types) {
         // Expand 'file' to include 'file_chunk' since File nodes don't have embeddings
         const expandedTypes = options.types.flatMap(type => {
           if (type === 'file') {
@@ -259,101 +514,15 @@ export class UnifiedSearchService {
           return type;
         });
         
-        typeFilter = 'AND node.type IN $types';
         queryParams.types = expandedTypes;
       }
 
-      // Use Neo4j's native vector similarity search
+      // Use Neo4j's native vector index (HNSW, cosine) - scores come back from the
+      // index, no per-node similarity is computed in Cypher
+      // Read transaction: routable to read replicas, retried on transient errors
       // For file_chunk results: aggregate by parent file to show match counts
-      const result = await session.run(`
-        CALL db.index.vector.queryNodes('node_embedding_index', toInteger($limit), $queryVector)
-        YIELD node, score
-        WHERE score >= $minSimilarity ${typeFilter}
-        
-        // For FileChunk nodes, get parent File information
-        OPTIONAL MATCH (node)<-[:HAS_CHUNK]-(parentFile:File)
-        
-        // Determine the grouping key (file path for chunks, node id for others)
-        WITH node, score, parentFile,
-             CASE 
-               WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL THEN parentFile.path
-               ELSE COALESCE(node.id, node.path)
-             END AS groupKey,
-             CASE 
-               WHEN node.type = 'file_chunk' THEN parentFile.path 
-               ELSE null 
-             END AS filePathForChunks
-        
-        // Aggregate by groupKey (this groups all chunks from the same file together)
-        WITH groupKey,
-             filePathForChunks,
-             // Collect all matching nodes and their scores for this group
-             collect({
-               node: node, 
-               score: score, 
-               parentFile: parentFile
-             }) AS matches,
-             max(score) AS best_similarity,
-             avg(score) AS avg_similarity,
-             // Count only file_chunk nodes in this group
-             count(CASE WHEN node.type = 'file_chunk' THEN 1 END) AS chunks_matched
-        
-        // Get the best match from the group for returning
-        // Sort matches by score DESC and take the first one
-        WITH groupKey,
-             filePathForChunks,
-             matches,
-             best_similarity,
-             avg_similarity,
-             chunks_matched,
-             [m IN matches WHERE m.score = best_similarity][0] AS bestMatch
-        
-        // Extract fields from the best match
-        WITH groupKey,
-             bestMatch.node AS node,
-             bestMatch.score AS similarity,
-             bestMatch.parentFile AS parentFile,
-             best_similarity,
-             avg_similarity,
-             // Only set chunks_matched for file_chunk results
-             CASE WHEN bestMatch.node.type = 'file_chunk' THEN chunks_matched ELSE null END AS chunks_matched
-        
-        ORDER BY similarity DESC
-        LIMIT toInteger($finalLimit)
-        
-        RETURN CASE 
-                 WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
-                 THEN parentFile.path 
-                 ELSE COALESCE(node.id, node.path)
-               END AS id,
-               node.type AS type,
-               CASE 
-                 WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
-                 THEN parentFile.name 
-                 ELSE COALESCE(node.title, node.name)
-               END AS title,
-               node.name AS name,
-               node.description AS description,
-               node.content AS content,
-               node.path AS path,
-               CASE 
-                 WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
-                 THEN parentFile.absolute_path 
-                 ELSE node.absolute_path
-               END AS absolute_path,
-               node.text AS chunk_text,
-               node.chunk_index AS chunk_index,
-               node.id AS chunk_id,
-               similarity,
-               chunks_matched,
-               avg_similarity,
-               parentFile.path AS parent_file_path,
-               parentFile.absolute_path AS parent_file_absolute_path,
-               parentFile.name AS parent_file_name,
-               parentFile.language AS parent_file_language
-      `, { ...queryParams, minSimilarity, finalLimit: limit });
-
-      return result.records.map(record => this.formatSearchResult(record, 'vector'));
+      const cypher = hasTypeFilter ? VECTOR_SEARCH_CYPHER.typed : VECTOR_SEARCH_CYPHER.all;
+      return await session.executeRead(tx => this.collectSearchResults(tx.run(cypher, { ...queryParams, minSimilarity, finalLimit: limit }), 'vector'));
       
     } finally {
       await session.close();
@@ -362,10 +531,11 @@ export class UnifiedSearchService {
 
   /**
    * Full-text keyword search using Neo4j's native BM25-powered Lucene index
-   * Supports fuzzy matching, proximity search, field boosting, and boolean operators
+   * Query terms are matched by the index (OR semantics, BM25 scoring) - no
+   * per-node CONTAINS scanning. Lucene operators are escaped; AND/OR/NOT still apply.
    */
   private async fullTextSearch(query: string, options: UnifiedSearchOptions): Promise<SearchResult[]> {
-    const session = this.driver.session();
+    const session = this.driver.session({ defaultAccessMode: neo4j.session.READ });
     
     try {
       const limit = options.limit || 100;
@@ -382,53 +552,21 @@ export class UnifiedSearchService {
       }
 
       // Use Neo4j's native BM25-powered full-text search
-      const result = await session.run(
-        `
-        CALL db.index.fulltext.queryNodes('node_search', $query)
-        YIELD node, score
-        
-        // Filter by type if specified
-        ${expandedTypes && expandedTypes.length > 0 ? 'WHERE node.type IN $types' : ''}
-        
-        // For FileChunk nodes, get parent File information
-        OPTIONAL MATCH (node)<-[:HAS_CHUNK]-(parentFile:File)
-        
-        RETURN COALESCE(node.id, node.path) AS id,
-               node.type AS type,
-               COALESCE(node.title, node.name) AS title,
-               node.name AS name,
-               node.description AS description,
-               node.content AS content,
-               node.path AS path,
-               CASE 
-                 WHEN node.type = 'file_chunk' AND parentFile IS NOT NULL 
-                 THEN parentFile.absolute_path 
-                 ELSE node.absolute_path
-               END AS absolute_path,
-               node.text AS chunk_text,
-               node.chunk_index AS chunk_index,
-               parentFile.path AS parent_file_path,
-               parentFile.absolute_path AS parent_file_absolute_path,
-               parentFile.name AS parent_file_name,
-               parentFile.language AS parent_file_language,
-               score AS relevance
-        ORDER BY score DESC
-        LIMIT $limit
-        `,
+      const cypher = expandedTypes && expandedTypes.length > 0 ? FULLTEXT_SEARCH_CYPHER.typed : FULLTEXT_SEARCH_CYPHER.all;
+      return await session.executeRead(tx => this.collectSearchResults(tx.run(
+        cypher,
         { 
-          query, 
+          query: query.replace(LUCENE_SPECIAL_CHARS, '\\$&').replace(WHITESPACE_RUN, ' ').trim(), 
           types: expandedTypes || [],
           limit: neo4j.int(limit) 
         }
-      );
-
-      return result.records.map(record => this.formatSearchResult(record, 'fulltext'));
+      ), 'fulltext'));
       
     } catch (error: any) {
       // Fallback to basic search if full-text index doesn't exist
       if (error.code === 'Neo.ClientError.Schema.IndexNotFound') {
-        console.warn('⚠️  Full-text index "node_search" not found. Creating it...');
-        console.warn('⚠️  Run: CREATE FULLTEXT INDEX node_search FOR (n:File|FileChunk|Memory|Todo|Concept) ON EACH [n.content, n.text, n.title, n.name, n.description]');
+        console.warn('⚠️  Full-text index "node_content_search" not found (created on next startup)');
+        console.warn('⚠️  Run: CREATE FULLTEXT INDEX node_content_search FOR (n:Node) ON EACH [n.title, n.name, n.description, n.content, n.text, n.path]');
         
         // Return empty results for now
         return [];
@@ -439,27 +577,46 @@ export class UnifiedSearchService {
     }
   }
 
+  /**
+   * Format records as they stream in from Bolt
+   *
+   * Iterating the result formats each record while later ones are still
+   * arriving, instead of buffering the full records array first.
+   */
+  private async collectSearchResults(result: Result, searchMethod: 'vector' | 'fulltext'): Promise<SearchResult[]> {
+    const results: SearchResult[] = [];
+    for await (const record of result) {
+      results.push(this.formatSearchResult(record, searchMethod));
+    }
+    return results;
+  }
+
   /**
    * Format search result from Neo4j record
    */
   private formatSearchResult(record: any, searchMethod: 'vector' | 'fulltext'): SearchResult {
-    const content = record.get('content');
-    const description = record.get('description');
-    const title = record.get('title');
-    const name = record.get('name');
-    const path = record.get('path');
-    const absolutePath = record.get('absolute_path');
-    const chunkText = record.get('chunk_text');
-    const chunkIndex = record.get('chunk_index');
-    // chunk_id only exists in vector search results
-    const chunkId = record.has('chunk_id') ? record.get('chunk_id') : null;
-    const chunksMatched = record.has('chunks_matched') ? record.get('chunks_matched') : null;
-    const avgSimilarity = record.has('avg_similarity') ? record.get('avg_similarity') : null;
-    const parentFilePath = record.get('parent_file_path');
-    const parentFileAbsolutePath = record.get('parent_file_absolute_path');
-    const parentFileName = record.get('parent_file_name');
-    const parentFileLanguage = record.get('parent_file_language');
-    const nodeType = record.get('type');
+    // One pass over the record's fields instead of a keyed get() per column;
+    // chunks_matched and avg_similarity only exist in vector results
+    const {
+      content,
+      description,
+      title,
+      name,
+      path,
+      absolute_path: absolutePath,
+      chunk_text: chunkText,
+      chunk_index: chunkIndex,
+      chunks_matched: chunksMatched = null,
+      avg_similarity: avgSimilarity = null,
+      parent_file_path: parentFilePath,
+      parent_file_absolute_path: parentFileAbsolutePath,
+      parent_file_name: parentFileName,
+      parent_file_language: parentFileLanguage,
+      type: nodeType,
+      id,
+      similarity,
+      relevance
+    } = record.toObject();
     
     // Create a preview from available text fields
     let preview = '';
@@ -470,7 +627,7 @@ export class UnifiedSearchService {
     else if (content && typeof content === 'string') preview = content.substring(0, 200);
     
     const resultObj: SearchResult = {
-      id: record.get('id'),
+      id,
       type: nodeType,
       title: title || name || null,
       description: description || null,
@@ -479,12 +636,12 @@ export class UnifiedSearchService {
     
     // Add score based on search method
     if (searchMethod === 'vector') {
-      resultObj.similarity = record.get('similarity');
+      resultObj.similarity = similarity;
       if (avgSimilarity) {
         resultObj.avg_similarity = avgSimilarity;
       }
     } else {
-      resultObj.relevance = record.get('relevance');
+      resultObj.relevance = relevance;
     }
     
     // Add chunk-specific information
@@ -532,23 +689,24 @@ export class UnifiedSearchService {
     try {
       const limit = Math.floor(options.limit || 50);
       
-      console.log(`🔍 RRF: Starting hybrid search for query: "${query}"`);
-      
-      // Step 1: Get vector search results (cosine similarity ranking)
-      const vectorResults = await this.vectorSearch(query, {
-        ...options,
-        limit: Math.floor(limit * 2) // Get more candidates for better fusion
-      });
+      debugLog(`🔍 RRF: Starting hybrid search for query: "${query}"`);
       
-      console.log(`🔍 RRF: Vector search returned ${vectorResults.length} results`);
+      // Steps 1+2: Vector search (cosine similarity ranking) and BM25 keyword
+      // search are independent - run them concurrently on separate sessions
+      // so the slower one bounds latency instead of their sum
+      const [vectorResults, bm25Results] = await Promise.all([
+        this.vectorSearch(query, {
+          ...options,
+          limit: Math.floor(limit * 2) // Get more candidates for better fusion
+        }),
+        this.fullTextSearch(query, {
+          ...options,
+          limit: Math.floor(limit * 2)
+        })
+      ]);
       
-      // Step 2: Get BM25 keyword search results
-      const bm25Results = await this.fullTextSearch(query, {
-        ...options,
-        limit: Math.floor(limit * 2)
-      });
-      
-      console.log(`🔍 RRF: BM25 search returned ${bm25Results.length} results`);
+      debugLog(`🔍 RRF: Vector search returned ${vectorResults.length} results`);
+      debugLog(`🔍 RRF: BM25 search returned ${bm25Results.length} results`);
       
       if (vectorResults.length === 0 && bm25Results.length === 0) {
         return {
@@ -576,12 +734,10 @@ export class UnifiedSearchService {
       
       const rrf = new ReciprocalRankFusion(rrfConfig);
       
-      console.log(`🔍 RRF: Using config - k=${rrfConfig.k}, vectorWeight=${rrfConfig.vectorWeight}, bm25Weight=${rrfConfig.bm25Weight}`);
-      
-      const fusedResults = rrf.fuse(vectorResults, bm25Results);
+      debugLog(`🔍 RRF: Using config - k=${rrfConfig.k}, vectorWeight=${rrfConfig.vectorWeight}, bm25Weight=${rrfConfig.bm25Weight}`);
       
-      // Step 4: Limit to requested number of results
-      const finalResults = fusedResults.slice(0, limit);
+      // Step 4: Fuse and keep the requested number of results (top-k, no full sort)
+      const { results: finalResults, total: fusedTotal } = rrf.fuseTopK(vectorResults, bm25Results, limit);
       
       const totalTime = Date.now() - startTime;
       
@@ -589,7 +745,7 @@ export class UnifiedSearchService {
         status: 'success',
         query,
         results: finalResults,
-        total_candidates: fusedResults.length,
+        total_candidates: fusedTotal,
         returned: finalResults.length,
         search_method: 'rrf_hybrid',
         fallback_triggered: false,
@@ -603,7 +759,7 @@ export class UnifiedSearchService {
           candidatesPerMethod: {
             vector: vectorResults.length,
             bm25: bm25Results.length,
-            fused: fusedResults.length
+            fused: fusedTotal
           }
         }
       };
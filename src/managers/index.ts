@@ -26,6 +26,7 @@
 import { GraphManager } from './GraphManager.js';
 import { TodoManager } from './TodoManager.js';
 import { UnifiedSearchService } from './UnifiedSearchService.js';
+import type { Driver } from 'neo4j-driver';
 import type { IGraphManager } from '../types/index.js';
 
 export { GraphManager, TodoManager, UnifiedSearchService };
@@ -88,6 +89,58 @@ export async function createGraphManager(): Promise<GraphManager> {
   return manager;
 }
 
+// Process-wide GraphManager - one driver and one connection pool shared by
+// the MCP tools and every HTTP route instead of a driver per request
+let sharedGraphManager: Promise<GraphManager> | null = null;
+
+/**
+ * Get the shared, initialized GraphManager (created on first call)
+ * 
+ * @description Schema initialization and the Bolt handshake happen once per
+ * process; later calls reuse the same driver and its connection pool.
+ * A failed connection is not cached, so the next call retries.
+ * 
+ * @returns Promise resolving to the shared GraphManager instance
+ * @throws {Error} If connection to Neo4j fails
+ * 
+ * @example
+ * ```typescript
+ * const session = (await getSharedGraphManager()).getDriver().session();
+ * ```
+ */
+export function getSharedGraphManager(): Promise<GraphManager> {
+  if (!sharedGraphManager) {
+    sharedGraphManager = createGraphManager().catch(error => {
+      sharedGraphManager = null;
+      throw error;
+    });
+  }
+  return sharedGraphManager;
+}
+
+/**
+ * Get the pooled Neo4j driver of the shared GraphManager
+ * 
+ * Callers open (and close) sessions only - never close the driver itself.
+ */
+export async function getSharedDriver(): Promise<Driver> {
+  return (await getSharedGraphManager()).getDriver();
+}
+
+/**
+ * Close the shared GraphManager and its driver (on shutdown)
+ */
+export async function closeSharedGraphManager(): Promise<void> {
+  if (!sharedGraphManager) return;
+  const pending = sharedGraphManager;
+  sharedGraphManager = null;
+  try {
+    await (await pending).close();
+  } catch (error) {
+    // Never connected - nothing to close
+  }
+}
+
 /**
  * Create a TodoManager instance
  * Requires an initialized GraphManager
@@ -8,16 +8,15 @@ import { promises as fs } from 'fs';
 import path from 'path';
 import { FileWatchManager } from '../indexing/FileWatchManager.js';
 import { WatchConfigManager } from '../indexing/WatchConfigManager.js';
-import { getEmbeddingsConfig, isEmbeddingsEnabled } from '../config/embeddings-config.js';
+import { isEmbeddingsEnabled } from '../config/embeddings-config.js';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
 import {
   translateHostToContainer,
   translateContainerToHost,
   validateAndSanitizePath,
-  pathExists,
 } from '../utils/path-utils.js';
 import type {
   WatchConfigInput,
-  WatchFolderResponse,
   IndexFolderResponse,
   ListWatchedFoldersResponse
 } from '../types/index.js';
@@ -364,6 +363,7 @@ export async function handleRemoveFolder(
     
     filesDeleted += pathFilesDeleted;
     chunksDeleted += pathChunksDeleted;
+    invalidateSearchCache();
     
     if (pathFilesDeleted > 0) {
       console.log(`🧹 Cleaned up ${pathFilesDeleted} orphaned files (no relationships) via path matching`);
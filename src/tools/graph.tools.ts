@@ -124,7 +124,7 @@ Examples:
         },
         depth: {
           type: "number",
-          description: "Traversal depth for neighbors/subgraph (default: 1 for neighbors, 2 for subgraph)"
+          description: "Traversal depth for neighbors/subgraph (default: 1 for neighbors, 2 for subgraph; capped at 5)"
         },
         properties: {
           type: "object",
@@ -14,7 +14,12 @@ function isSerializable(v: any): boolean {
   }
 }
 
-function _flatten(obj: Record<string, any>, parent = '', depth = 0): Record<string, any> {
+/**
+ * `serializable` is set once an ancestor object has passed isSerializable -
+ * every value below it is then known to stringify, so the check (a full
+ * JSON.stringify of the subtree) is not repeated at each nesting level
+ */
+function _flatten(obj: Record<string, any>, parent = '', depth = 0, serializable = false): Record<string, any> {
   const out: Record<string, any> = {};
   
   // Safety: prevent infinite recursion (max depth 10)
@@ -69,12 +74,12 @@ function _flatten(obj: Record<string, any>, parent = '', depth = 0): Record<stri
     // Handle plain objects
     else if (typeof v === 'object' && v !== null && v.constructor === Object) {
       // Check for circular references before recursing
-      if (!isSerializable(v)) {
+      if (!serializable && !isSerializable(v)) {
         console.warn(`⚠️  flattenForMCP: object at key '${key}' contains circular references, using string representation`);
         out[key] = String(v);
       } else {
         // Recurse into nested object
-        const nested = _flatten(v as Record<string, any>, key, depth + 1);
+        const nested = _flatten(v as Record<string, any>, key, depth + 1, true);
         Object.assign(out, nested);
       }
     }
@@ -90,10 +95,11 @@ function _flatten(obj: Record<string, any>, parent = '', depth = 0): Record<stri
     }
     // Handle other object types (class instances, etc.) - serialize to JSON
     else if (typeof v === 'object' && v !== null) {
-      // Check for circular references before attempting JSON.stringify
-      if (isSerializable(v)) {
+      // Stringify once - a failure (circular references, BigInt) falls back
+      // to the string representation
+      try {
         out[`${key}_raw_json`] = JSON.stringify(v);
-      } else {
+      } catch {
         console.warn(`⚠️  flattenForMCP: object at key '${key}' contains circular references or is not serializable, using string representation`);
         out[key] = String(v);
       }
@@ -5,11 +5,144 @@
  */
 
 import { Tool } from '@modelcontextprotocol/sdk/types.js';
-import { Driver } from 'neo4j-driver';
+import neo4j, { Driver } from 'neo4j-driver';
 import { existsSync } from 'fs';
-import { UnifiedSearchService } from '../managers/UnifiedSearchService.js';
+import { UnifiedSearchService, invalidateSearchCache, getSearchCacheEpoch } from '../managers/UnifiedSearchService.js';
 import { applyPathMappingToResult, translateContainerToHost } from '../utils/path-utils.js';
 import { getRequestPathMappings } from '../http-server.js';
+import { debugLog } from '../utils/logger.js';
+import { LRUCache } from '../utils/lru-cache.js';
+
+// Cleared after the first ProcedureNotFound so multi-hop searches go straight
+// to the plain Cypher neighbor query instead of failing on APOC every call
+let apocTraversalAvailable = true;
+
+// One search service per driver, reused across tool calls: initialize() then
+// runs once instead of re-reading embeddings config (and logging it) per search
+const searchServices = new WeakMap<Driver, UnifiedSearchService>();
+
+function getSearchService(driver: Driver): UnifiedSearchService {
+  let service = searchServices.get(driver);
+  if (!service) {
+    service = new UnifiedSearchService(driver);
+    searchServices.set(driver, service);
+  }
+  return service;
+}
+
+// Connected nodes per (depth, limit, result ids), sized, aged and invalidated
+// like the search cache. Created on first use so values loaded by dotenv after
+// import still apply
+const getTraversalCacheSize = () => parseInt(process.env.MIMIR_SEARCH_CACHE_SIZE || '0', 10);
+const getTraversalCacheTtlMs = () => parseInt(process.env.MIMIR_SEARCH_CACHE_TTL_MS || '60000', 10);
+let traversalCacheInstance: LRUCache<string, any[]> | null = null;
+let traversalCacheEpoch = 0;
+function traversalCache(): LRUCache<string, any[]> {
+  traversalCacheInstance ??= new LRUCache({
+    maxSize: getTraversalCacheSize(),
+    ttlMs: getTraversalCacheTtlMs()
+  });
+  // Edges or nodes changed since these traversals were cached
+  if (traversalCacheEpoch !== getSearchCacheEpoch()) {
+    traversalCacheEpoch = getSearchCacheEpoch();
+    traversalCacheInstance.clear();
+  }
+  return traversalCacheInstance;
+}
+
+/**
+ * Fetch nodes connected to the top search results, up to depth - 1 hops away
+ *
+ * Uses APOC subgraph expansion when available, otherwise a plain
+ * variable-length Cypher match. Nodes listed in resultIds are excluded.
+ */
+async function traverseConnectedNodes(
+  driver: Driver,
+  nodeIds: string[],
+  resultIds: string[],
+  depth: number,
+  limit: number
+): Promise<any[]> {
+  const session = driver.session();
+  try {
+    if (apocTraversalAvailable) {
+      try {
+        // Multi-hop traversal query
+        const traversalResult = await session.run(
+          `
+          MATCH (start:Node)
+          WHERE start.id IN $nodeIds
+          CALL apoc.path.subgraphNodes(start, {
+            maxLevel: $maxDepth,
+            relationshipFilter: "EDGE",
+            labelFilter: "+Node"
+          })
+          YIELD node
+          WHERE NOT node.id IN $resultIds
+          RETURN DISTINCT 
+            node.id as id,
+            node.type as type,
+            node.title as title,
+            // Only a 200-char preview is used - don't ship whole documents over Bolt
+            CASE WHEN node.content IS :: STRING THEN left(node.content, 200) END as content
+          LIMIT $expandLimit
+          `,
+          { 
+            nodeIds, 
+            resultIds,
+            maxDepth: neo4j.int(depth - 1),
+            expandLimit: neo4j.int(limit * 2) // Fetch more connected nodes
+          }
+        );
+    
+        // Format connected nodes
+        return traversalResult.records.map(record => ({
+          id: record.get('id'),
+          type: record.get('type'),
+          title: record.get('title') || 'Untitled',
+          description: `Connected via graph traversal (depth ${depth})`,
+          content_preview: (record.get('content') || '').substring(0, 200),
+          similarity: 0.0, // Mark as connected, not direct match
+        }));
+      } catch (traversalError: any) {
+        // Remember a missing APOC so later searches skip the failing round trip
+        if (traversalError.code === 'Neo.ClientError.Procedure.ProcedureNotFound') {
+          apocTraversalAvailable = false;
+        }
+        console.warn('APOC traversal failed, using simple neighbor query:', traversalError.message);
+      }
+    }
+    
+    // Simple neighbor query when APOC is unavailable
+    // Variable-length bounds cannot be parameters; depth is clamped to 2-3 by the caller
+    const neighborResult = await session.run(
+      `
+      MATCH (start:Node)-[r:EDGE*1..${depth - 1}]-(connected:Node)
+      WHERE start.id IN $nodeIds
+        AND NOT connected.id IN $resultIds
+      RETURN DISTINCT
+        connected.id as id,
+        connected.type as type,
+        connected.title as title,
+        // Only a 200-char preview is used - don't ship whole documents over Bolt
+        CASE WHEN connected.content IS :: STRING THEN left(connected.content, 200) END as content
+      LIMIT $expandLimit
+      `,
+      { nodeIds, resultIds, expandLimit: neo4j.int(limit * 2) }
+    );
+  
+    return neighborResult.records.map(record => ({
+      id: record.get('id'),
+      type: record.get('type'),
+      title: record.get('title') || 'Untitled',
+      description: `Connected via simple neighbor query (depth ${depth})`,
+      content_preview: (record.get('content') || '').substring(0, 200),
+      similarity: 0.0,
+    }));
+  } finally {
+    await session.close();
+  }
+}
 
 /**
  * Lazy file existence check - filters out results for deleted files
@@ -24,6 +157,8 @@ async function filterDeletedFiles(results: any[], driver: Driver): Promise<any[]
 
   const validResults: any[] = [];
   const deletedNodeIds: string[] = [];
+  // Chunks of one file share its path - stat each file only once
+  const pathExists = new Map<string, boolean>();
 
   for (const result of results) {
     // Get the path to check - try multiple fields since absolute_path is often null
@@ -32,8 +167,8 @@ async function filterDeletedFiles(results: any[], driver: Driver): Promise<any[]
       || result.parent_file?.path  // path often contains absolute path
       || result.path;
 
-    // Debug: log what we're checking
-    console.log(`🔍 Lazy check: type=${result.type}, path=${pathToCheck || 'NONE'}, id=${result.id?.substring(0, 20)}...`);
+    // Debug: log what we're checking (once per result - verbose only)
+    debugLog(`🔍 Lazy check: type=${result.type}, path=${pathToCheck || 'NONE'}, id=${result.id?.substring(0, 20)}...`);
 
     // Only check file-related types
     const isFileRelated = result.type === 'file' || result.type === 'file_chunk' || pathToCheck;
@@ -47,7 +182,13 @@ async function filterDeletedFiles(results: any[], driver: Driver): Promise<any[]
     // Translate container path to host path if needed
     const hostPath = translateContainerToHost(pathToCheck);
 
-    if (existsSync(hostPath)) {
+    let exists = pathExists.get(hostPath);
+    if (exists === undefined) {
+      exists = existsSync(hostPath);
+      pathExists.set(hostPath, exists);
+    }
+
+    if (exists) {
       validResults.push(result);
     } else {
       // File doesn't exist - collect for cleanup
@@ -81,6 +222,7 @@ async function cleanupDeletedNodes(nodeIds: string[], driver: Driver): Promise<v
       DETACH DELETE chunk, n
     `, { nodeIds });
 
+    invalidateSearchCache();
     console.log(`🧹 Cleaned up ${nodeIds.length} stale file(s) from index`);
   } catch (error: any) {
     console.error('Failed to cleanup deleted nodes:', error.message);
@@ -200,11 +342,11 @@ export async function handleVectorSearchNodes(
   params: any,
   driver: Driver
 ): Promise<any> {
-  const searchService = new UnifiedSearchService(driver);
+  const searchService = getSearchService(driver);
   await searchService.initialize();
   
   try {
-    const depth = Math.max(1, Math.min(3, params.depth || 1)); // Clamp 1-3
+    const depth = Math.max(1, Math.min(3, Math.floor(params.depth || 1))); // Clamp 1-3
     const limit = params.limit || 10;
     
     // Initial vector search (with optional advanced search)
@@ -219,103 +361,40 @@ export async function handleVectorSearchNodes(
       rrfMinScore: params.rrf_min_score
     });
     
+    // Get connected nodes for top results (up to 5 to avoid explosion).
+    // file_chunk results are keyed by their parent file path and chunks carry
+    // no EDGE relationships, so they can never start a traversal - when only
+    // chunks are on top, skip the traversal query entirely
+    const nodeIds = (result.results || [])
+      .slice(0, 5)
+      .filter((r: any) => r.type !== 'file_chunk')
+      .map((r: any) => r.id);
+    
     // If depth > 1, perform multi-hop graph traversal
-    if (depth > 1 && result.results && result.results.length > 0) {
-      const session = driver.session();
-      try {
-        // Get connected nodes for top results (up to 5 to avoid explosion)
-        const topResults = result.results.slice(0, Math.min(5, result.results.length));
-        const nodeIds = topResults.map((r: any) => r.id);
-        
-        // Multi-hop traversal query
-        const traversalResult = await session.run(
-          `
-          MATCH (start:Node)
-          WHERE start.id IN $nodeIds
-          CALL apoc.path.subgraphNodes(start, {
-            maxLevel: $maxDepth,
-            relationshipFilter: "EDGE",
-            labelFilter: "+Node"
-          })
-          YIELD node
-          WHERE node.id <> start.id
-          RETURN DISTINCT 
-            node.id as id,
-            node.type as type,
-            node.title as title,
-            node.content as content,
-            labels(node) as labels,
-            properties(node) as props
-          LIMIT $expandLimit
-          `,
-          { 
-            nodeIds, 
-            maxDepth: depth - 1,
-            expandLimit: limit * 2 // Fetch more connected nodes
-          }
-        );
-        
-        // Format connected nodes
-        const connectedNodes = traversalResult.records.map(record => ({
-          id: record.get('id'),
-          type: record.get('type'),
-          title: record.get('title') || 'Untitled',
-          description: `Connected via graph traversal (depth ${depth})`,
-          content_preview: (record.get('content') || '').substring(0, 200),
-          similarity: 0.0, // Mark as connected, not direct match
-        }));
-        
-        // Merge with original results (cast to any to allow custom properties on result object)
-        const enhancedResult = result as any;
-        enhancedResult.results = [...result.results, ...connectedNodes];
-        enhancedResult.total_candidates = enhancedResult.results.length;
-        enhancedResult.returned = enhancedResult.results.length;
-        enhancedResult.depth_used = depth;
-        enhancedResult.multi_hop_enabled = true;
-        enhancedResult.connected_nodes_count = connectedNodes.length;
-        
-      } catch (traversalError: any) {
-        // If APOC is not available, fall back to simple neighbor query
-        console.warn('APOC traversal failed, using simple neighbor query:', traversalError.message);
-        
-        const topResults = result.results.slice(0, Math.min(5, result.results.length));
-        const nodeIds = topResults.map((r: any) => r.id);
-        
-        const neighborResult = await session.run(
-          `
-          MATCH (start:Node)-[r:EDGE*1..${depth - 1}]-(connected:Node)
-          WHERE start.id IN $nodeIds
-            AND connected.id <> start.id
-          RETURN DISTINCT
-            connected.id as id,
-            connected.type as type,
-            connected.title as title,
-            connected.content as content
-          LIMIT ${limit * 2}
-          `,
-          { nodeIds }
-        );
-        
-        const connectedNodes = neighborResult.records.map(record => ({
-          id: record.get('id'),
-          type: record.get('type'),
-          title: record.get('title') || 'Untitled',
-          description: `Connected via simple neighbor query (depth ${depth})`,
-          content_preview: (record.get('content') || '').substring(0, 200),
-          similarity: 0.0,
-        }));
-        
-        const enhancedResult = result as any;
-        enhancedResult.results = [...result.results, ...connectedNodes];
-        enhancedResult.total_candidates = enhancedResult.results.length;
-        enhancedResult.returned = enhancedResult.results.length;
-        enhancedResult.depth_used = depth;
-        enhancedResult.multi_hop_enabled = true;
-        enhancedResult.connected_nodes_count = connectedNodes.length;
-        
-      } finally {
-        await session.close();
+    if (depth > 1 && nodeIds.length > 0) {
+      // Nodes already in the results (start nodes included) are filtered out
+      // in the query, before LIMIT, so the expansion budget goes to new nodes
+      // and the merged list carries no duplicates
+      const resultIds = result.results.map((r: any) => r.id);
+
+      // The traversal only depends on which nodes came back, not on the query
+      // text - rephrased follow-up questions hitting the same nodes reuse it
+      const cacheKey = JSON.stringify([depth, limit, resultIds]);
+      let connectedNodes = traversalCache().get(cacheKey);
+      if (!connectedNodes) {
+        connectedNodes = await traverseConnectedNodes(driver, nodeIds, resultIds, depth, limit);
+        traversalCache().set(cacheKey, connectedNodes);
       }
+
+      // Merge with original results (cast to any to allow custom properties on result object).
+      // Copies keep later per-request mutation (e.g. path mapping) out of the cache
+      const enhancedResult = result as any;
+      enhancedResult.results = [...result.results, ...connectedNodes.map(node => ({ ...node }))];
+      enhancedResult.total_candidates = enhancedResult.results.length;
+      enhancedResult.returned = enhancedResult.results.length;
+      enhancedResult.depth_used = depth;
+      enhancedResult.multi_hop_enabled = true;
+      enhancedResult.connected_nodes_count = connectedNodes.length;
     }
     
     // Lazy cleanup: filter out results for deleted files
@@ -381,7 +460,7 @@ export async function handleGetEmbeddingStats(
   params: any,
   driver: Driver
 ): Promise<any> {
-  const searchService = new UnifiedSearchService(driver);
+  const searchService = getSearchService(driver);
   await searchService.initialize();
   
   const session = driver.session();
@@ -146,6 +146,7 @@ export interface IGraphManager {
   
   /**
    * Get neighboring nodes
+   * Note: depth is clamped to 1-5 hops (default 1).
    */
   getNeighbors(
     nodeId: string,
@@ -155,6 +156,7 @@ export interface IGraphManager {
   
   /**
    * Get a subgraph starting from a node
+   * Note: depth is clamped to 1-5 hops (default 2).
    */
   getSubgraph(
     nodeId: string,
@@ -1,4 +1,5 @@
 import { Driver } from 'neo4j-driver';
+import { invalidateSearchCache } from '../managers/UnifiedSearchService.js';
 
 /**
  * Data Retention Configuration
@@ -169,6 +170,7 @@ export async function runDataRetentionCleanup(driver: Driver, config: DataRetent
     }
     
     if (totalDeleted > 0) {
+      invalidateSearchCache();
       console.log(`[Data Retention] Cleanup complete - deleted ${totalDeleted} nodes total`);
     } else {
       console.log('[Data Retention] Cleanup complete - no nodes to delete');
@@ -0,0 +1,65 @@
+/**
+ * Verbose Logging
+ *
+ * Per-request and per-record diagnostics (search stages, lazy file checks,
+ * fast-skip lines, per-file and per-node embedding/chunk lines) only print
+ * when MIMIR_VERBOSE=true. console.log is a
+ * synchronous write when stdout is a file or pipe, so lines emitted once per
+ * record stay off the hot path by default. Warnings that every concurrent
+ * request raises at once (a provider outage) go through throttledWarn.
+ */
+
+// Minimum gap between two throttledWarn lines with the same key
+const getWarnThrottleMs = () => parseInt(process.env.MIMIR_LOG_THROTTLE_MS || '5000', 10);
+
+const lastWarnings = new Map<string, { at: number; suppressed: number }>();
+
+/**
+ * Whether verbose diagnostics are enabled (MIMIR_VERBOSE=true)
+ *
+ * Read per call so values loaded by dotenv after module import still apply.
+ * Guard loops with it so the log message is not even built when disabled.
+ *
+ * @example
+ * if (isVerbose()) {
+ *   for (const r of results) console.log(`🔍 ${r.id}: ${r.similarity}`);
+ * }
+ */
+export const isVerbose = (): boolean => process.env.MIMIR_VERBOSE === 'true';
+
+/**
+ * console.log gated on MIMIR_VERBOSE
+ *
+ * @example
+ * debugLog(`🔍 RRF: Vector search returned ${vectorResults.length} results`);
+ */
+export function debugLog(...args: unknown[]): void {
+  if (isVerbose()) {
+    console.log(...args);
+  }
+}
+
+/**
+ * console.warn at most once per MIMIR_LOG_THROTTLE_MS for a given key
+ *
+ * When the embeddings server goes down, every in-flight request hits the same
+ * retry branch in the same tick and would write its own stderr line - each a
+ * blocking write while dozens of callers wait. Repeats inside the window are
+ * counted instead and reported with the next line that gets through.
+ *
+ * @example
+ * throttledWarn('embeddings:connection refused', `⏳ Embedding server unavailable...`);
+ * // ...later: "⏳ Embedding server unavailable... (+23 similar suppressed)"
+ */
+export function throttledWarn(key: string, message: string): void {
+  const now = Date.now();
+  const last = lastWarnings.get(key);
+  if (last && now - last.at < getWarnThrottleMs()) {
+    last.suppressed++;
+    return;
+  }
+
+  const suffix = last?.suppressed ? ` (+${last.suppressed} similar suppressed)` : '';
+  lastWarnings.set(key, { at: now, suppressed: 0 });
+  console.warn(message + suffix);
+}
@@ -0,0 +1,59 @@
+/**
+ * LRU Cache
+ *
+ * Small bounded cache on top of Map insertion order: a hit re-inserts the key
+ * so the first key in the Map is always the least recently used one.
+ * Optional TTL expires entries lazily on read.
+ */
+
+export interface LRUCacheOptions {
+  maxSize: number;   // Maximum entries kept (0 disables the cache)
+  ttlMs?: number;    // Entry lifetime in ms (default: no expiry)
+}
+
+export class LRUCache<K, V> {
+  private entries = new Map<K, { value: V; expiresAt: number }>();
+  private maxSize: number;
+  private ttlMs: number;
+
+  constructor(options: LRUCacheOptions) {
+    this.maxSize = Math.max(0, options.maxSize);
+    this.ttlMs = options.ttlMs && options.ttlMs > 0 ? options.ttlMs : Infinity;
+  }
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    this.entries.delete(key);
+    if (entry.expiresAt <= Date.now()) {
+      return undefined;
+    }
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    if (this.maxSize === 0) return;
+
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+
+    while (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next().value as K;
+      this.entries.delete(oldest);
+    }
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
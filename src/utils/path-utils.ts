@@ -170,13 +170,8 @@ export function isRunningInDocker(): boolean {
   // 1. /.dockerenv file exists (most reliable)
   // 2. WORKSPACE_ROOT environment variable is set (our Docker convention)
   
-  try {
-    // Check for .dockerenv file
-    if (fsSync.existsSync('/.dockerenv')) {
-      return true;
-    }
-  } catch (e) {
-    // Ignore errors
+  if (hasDockerEnvFile()) {
+    return true;
   }
   
   // Check if WORKSPACE_ROOT is set (our Docker convention)
@@ -188,13 +183,43 @@ export function isRunningInDocker(): boolean {
   return false;
 }
 
+// /.dockerenv cannot appear or vanish while the process runs - probe the
+// filesystem once instead of on every path translation (called per indexed file)
+let dockerEnvFileExists: boolean | null = null;
+
+function hasDockerEnvFile(): boolean {
+  if (dockerEnvFileExists === null) {
+    try {
+      dockerEnvFileExists = fsSync.existsSync('/.dockerenv');
+    } catch (e) {
+      // Ignore errors
+      dockerEnvFileExists = false;
+    }
+  }
+  return dockerEnvFileExists;
+}
+
+// Resolved root memoized per (HOST_WORKSPACE_ROOT, Docker) combination - it
+// is looked up for every indexed file's host-path translation
+let hostWorkspaceRootCache: { source: string | undefined; docker: boolean; root: string } | null = null;
+
 /**
  * Get host workspace root path
  * @example const root = getHostWorkspaceRoot(); // => '/Users/john/src'
  */
 export function getHostWorkspaceRoot(): string {
-  const hostRoot = process.env.HOST_WORKSPACE_ROOT;
-  
+  const source = process.env.HOST_WORKSPACE_ROOT;
+  const docker = isRunningInDocker();
+  if (hostWorkspaceRootCache && hostWorkspaceRootCache.source === source && hostWorkspaceRootCache.docker === docker) {
+    return hostWorkspaceRootCache.root;
+  }
+
+  const root = resolveHostWorkspaceRoot(source);
+  hostWorkspaceRootCache = { source, docker, root };
+  return root;
+}
+
+function resolveHostWorkspaceRoot(hostRoot: string | undefined): string {
   // If not set, use default ~/src
   if (!hostRoot) {
     const defaultRoot = normalizeAndResolve('~/src');
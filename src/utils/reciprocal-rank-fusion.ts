@@ -16,6 +16,8 @@
  * - https://learn.microsoft.com/en-us/azure/search/hybrid-search-ranking
  */
 
+import { selectTopK } from './vector-math.js';
+
 export interface RRFConfig {
   k: number;              // Constant for rank normalization (default: 60)
   vectorWeight: number;   // Weight for vector search results (default: 1.0)
@@ -126,27 +128,66 @@ export class ReciprocalRankFusion {
     vectorResults: SearchResult[],
     bm25Results: SearchResult[]
   ): RRFResult[] {
-    // Create rank maps (1-indexed as per RRF formula)
+    const rrfScores = this.scoreAll(vectorResults, bm25Results);
+    
+    // Sort by RRF score descending
+    rrfScores.sort((a, b) => b.rrfScore - a.rrfScore);
+    
+    return rrfScores;
+  }
+  
+  /**
+   * Fuse ranked lists and keep only the best `limit` results
+   * 
+   * Same scores as fuse(), but the top results are picked with a bounded heap
+   * (selectTopK) instead of sorting every fused candidate and slicing.
+   * `total` is the number of candidates that passed minScore.
+   * 
+   * @example
+   * ```ts
+   * const { results, total } = rrf.fuseTopK(vectorResults, bm25Results, 10);
+   * ```
+   */
+  fuseTopK(
+    vectorResults: SearchResult[],
+    bm25Results: SearchResult[],
+    limit: number
+  ): { results: RRFResult[]; total: number } {
+    const rrfScores = this.scoreAll(vectorResults, bm25Results);
+    return {
+      results: selectTopK(rrfScores, limit, result => result.rrfScore),
+      total: rrfScores.length
+    };
+  }
+  
+  /**
+   * RRF score for every document above minScore (unordered)
+   */
+  private scoreAll(
+    vectorResults: SearchResult[],
+    bm25Results: SearchResult[]
+  ): RRFResult[] {
+    // Create rank maps (1-indexed as per RRF formula), and remember each
+    // id's first result (vector result preferred when in both)
+    const originals = new Map<string, SearchResult>();
+    
     const vectorRanks = new Map<string, number>();
     vectorResults.forEach((result, index) => {
       vectorRanks.set(result.id, index + 1);
+      if (!originals.has(result.id)) originals.set(result.id, result);
     });
     
     const bm25Ranks = new Map<string, number>();
     bm25Results.forEach((result, index) => {
       bm25Ranks.set(result.id, index + 1);
+      if (!originals.has(result.id)) originals.set(result.id, result);
     });
     
-    // Get all unique document IDs from both result sets
-    const allIds = new Set([
-      ...vectorRanks.keys(),
-      ...bm25Ranks.keys()
-    ]);
-    
-    // Calculate RRF scores for all documents
+    // Calculate RRF scores for all documents - originals already holds every
+    // unique id from both result sets, so no separate id set is built
     const rrfScores: RRFResult[] = [];
     
-    for (const id of allIds) {
+    for (const [id, originalResult] of originals) {
       const vectorRank = vectorRanks.get(id);
       const bm25Rank = bm25Ranks.get(id);
       
@@ -167,10 +208,6 @@ export class ReciprocalRankFusion {
         continue;
       }
       
-      // Get the original result (prefer vector result if available)
-      const originalResult = vectorResults.find(r => r.id === id) 
-        || bm25Results.find(r => r.id === id)!;
-      
       rrfScores.push({
         ...originalResult,
         rrfScore,
@@ -180,9 +217,6 @@ export class ReciprocalRankFusion {
       });
     }
     
-    // Sort by RRF score descending
-    rrfScores.sort((a, b) => b.rrfScore - a.rrfScore);
-    
     return rrfScores;
   }
   
@@ -0,0 +1,136 @@
+/**
+ * Semantic Cache
+ *
+ * Bounded cache looked up by embedding similarity instead of exact key: a
+ * rephrased query whose unit-length embedding is within the cosine threshold
+ * of a cached one reuses that entry. Entries are partitioned by an exact key
+ * (e.g. the search options) so only compatible entries are compared.
+ *
+ * Embeddings live in one preallocated row-major Float32Array (one row per
+ * slot) and a lookup scores every row in a single pass over it - 256 entries
+ * x 1024 dims is well under a millisecond, so no LSH bucketing is needed at
+ * this size. Same LRU/TTL policy as LRUCache.
+ */
+
+import { scoreRows, toFloat32 } from './vector-math.js';
+
+export interface SemanticCacheOptions {
+  maxSize: number;    // Maximum entries kept (0 disables the cache)
+  threshold: number;  // Minimum cosine similarity for a hit (0-1)
+  ttlMs?: number;     // Entry lifetime in ms (default: no expiry)
+}
+
+interface SemanticCacheSlot<V> {
+  key: string;
+  value: V;
+  expiresAt: number;
+  lastUsed: number;
+}
+
+export class SemanticCache<V> {
+  private maxSize: number;
+  private threshold: number;
+  private ttlMs: number;
+
+  // Row i of `vectors` is the embedding of slots[i]; sized on the first set()
+  private dimensions = 0;
+  private vectors = new Float32Array(0);
+  private scores = new Float32Array(0);
+  private slots: Array<SemanticCacheSlot<V> | undefined> = [];
+  private count = 0;
+  private clock = 0;
+
+  constructor(options: SemanticCacheOptions) {
+    this.maxSize = Math.max(0, options.maxSize);
+    this.threshold = options.threshold;
+    this.ttlMs = options.ttlMs && options.ttlMs > 0 ? options.ttlMs : Infinity;
+  }
+
+  /**
+   * Most similar live entry for `key` at or above the threshold
+   *
+   * Vectors must be unit length (see normalizeEmbedding) - the dot product
+   * is the cosine similarity.
+   *
+   * @example
+   * const cache = new SemanticCache<string>({ maxSize: 256, threshold: 0.95 });
+   * cache.set('opts', embedding, 'context');
+   * cache.get('opts', rephrasedEmbedding); // 'context' when cosine >= 0.95
+   */
+  get(key: string, vector: ArrayLike<number>): V | undefined {
+    if (this.count === 0 || vector.length !== this.dimensions) return undefined;
+
+    const query = toFloat32(vector);
+    const scores = scoreRows(this.vectors, query, this.scores.subarray(0, this.slots.length));
+
+    const now = Date.now();
+    let best = -1;
+    let bestScore = this.threshold;
+    for (let i = 0; i < this.slots.length; i++) {
+      const slot = this.slots[i];
+      if (!slot) continue;
+      if (slot.expiresAt <= now) {
+        this.slots[i] = undefined;
+        this.count--;
+        continue;
+      }
+      if (slot.key === key && scores[i] >= bestScore) {
+        best = i;
+        bestScore = scores[i];
+      }
+    }
+    if (best === -1) return undefined;
+
+    const slot = this.slots[best]!;
+    slot.lastUsed = ++this.clock;
+    return slot.value;
+  }
+
+  set(key: string, vector: ArrayLike<number>, value: V): void {
+    if (this.maxSize === 0) return;
+
+    // First entry, or the embedding model changed: (re)size the matrix
+    if (vector.length !== this.dimensions) {
+      this.dimensions = vector.length;
+      this.vectors = new Float32Array(this.maxSize * this.dimensions);
+      this.scores = new Float32Array(this.maxSize);
+      this.clear();
+    }
+
+    const index = this.freeSlot();
+    if (!this.slots[index]) this.count++;
+    this.vectors.set(vector, index * this.dimensions);
+    this.slots[index] = { key, value, expiresAt: Date.now() + this.ttlMs, lastUsed: ++this.clock };
+  }
+
+  clear(): void {
+    this.slots = [];
+    this.count = 0;
+  }
+
+  get size(): number {
+    return this.count;
+  }
+
+  /**
+   * Slot for a new entry: an unused or expired one, else the least recently used
+   */
+  private freeSlot(): number {
+    if (this.slots.length < this.maxSize) return this.slots.length;
+
+    const now = Date.now();
+    let lru = 0;
+    for (let i = 0; i < this.slots.length; i++) {
+      const slot = this.slots[i];
+      if (!slot || slot.expiresAt <= now) {
+        if (slot) {
+          this.slots[i] = undefined;
+          this.count--;
+        }
+        return i;
+      }
+      if (slot.lastUsed < this.slots[lru]!.lastUsed) lru = i;
+    }
+    return lru;
+  }
+}
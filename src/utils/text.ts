@@ -0,0 +1,23 @@
+/**
+ * Text Helpers
+ *
+ * Checks on node and document text, which can be megabytes long - none of
+ * them copy the string.
+ */
+
+const NON_BLANK = /\S/;
+
+/**
+ * Whether a string has any non-whitespace character
+ *
+ * Same answer as `!!s && s.trim().length > 0`, without trimming a copy of the
+ * whole string: the scan stops at the first non-blank character.
+ *
+ * @example
+ * hasText(' \n\t'); // false
+ * hasText('  a  '); // true
+ * hasText(null);    // false
+ */
+export function hasText(s: string | null | undefined): s is string {
+  return !!s && NON_BLANK.test(s);
+}
@@ -0,0 +1,148 @@
+/**
+ * Vector Math
+ *
+ * In-process similarity kernels for embeddings. Neo4j's HNSW index handles the
+ * server-side search; these cover re-ranking and ad-hoc comparisons in Node.
+ *
+ * Embeddings are stored in contiguous Float32Array buffers: half the memory
+ * of a number[] and monomorphic for V8, which keeps the inner loops tight.
+ * Loops are unrolled by 4 with independent accumulators so the multiply-adds
+ * can overlap instead of serializing on a single running sum.
+ */
+
+export type Vector = ArrayLike<number>;
+
+/**
+ * Copy an embedding into a contiguous Float32Array
+ *
+ * @example
+ * const q = toFloat32([0.1, 0.2, 0.3]);
+ */
+export function toFloat32(vector: Vector): Float32Array {
+  return vector instanceof Float32Array ? vector : Float32Array.from(vector);
+}
+
+/**
+ * Dot product of two equal-length vectors
+ *
+ * For unit-length embeddings (see normalizeEmbedding) this is the cosine similarity.
+ *
+ * @example
+ * dotProduct([1, 0], [0.6, 0.8]); // 0.6
+ */
+export function dotProduct(a: Vector, b: Vector): number {
+  const n = a.length;
+  let s0 = 0, s1 = 0, s2 = 0, s3 = 0;
+  let i = 0;
+  for (; i + 3 < n; i += 4) {
+    s0 += a[i] * b[i];
+    s1 += a[i + 1] * b[i + 1];
+    s2 += a[i + 2] * b[i + 2];
+    s3 += a[i + 3] * b[i + 3];
+  }
+  for (; i < n; i++) {
+    s0 += a[i] * b[i];
+  }
+  return (s0 + s1) + (s2 + s3);
+}
+
+/**
+ * Score every row of a row-major matrix against a query
+ *
+ * `matrix` packs `out.length` vectors of `query.length` floats back to back,
+ * so the whole scan walks one contiguous buffer instead of chasing a separate
+ * array per vector.
+ *
+ * @example
+ * const rows = Float32Array.of(1, 0, 0.6, 0.8);
+ * scoreRows(rows, Float32Array.of(1, 0), new Float32Array(2)); // [1, 0.6]
+ */
+export function scoreRows(matrix: Float32Array, query: Float32Array, out: Float32Array): Float32Array {
+  const dimensions = query.length;
+  const rows = out.length;
+  for (let row = 0, offset = 0; row < rows; row++, offset += dimensions) {
+    let s0 = 0, s1 = 0, s2 = 0, s3 = 0;
+    let i = 0;
+    for (; i + 3 < dimensions; i += 4) {
+      s0 += matrix[offset + i] * query[i];
+      s1 += matrix[offset + i + 1] * query[i + 1];
+      s2 += matrix[offset + i + 2] * query[i + 2];
+      s3 += matrix[offset + i + 3] * query[i + 3];
+    }
+    for (; i < dimensions; i++) {
+      s0 += matrix[offset + i] * query[i];
+    }
+    out[row] = (s0 + s1) + (s2 + s3);
+  }
+  return out;
+}
+
+/**
+ * Euclidean (L2) norm of a vector
+ *
+ * @example
+ * l2Norm([3, 4]); // 5
+ */
+export function l2Norm(vector: Vector): number {
+  return Math.sqrt(dotProduct(vector, vector));
+}
+
+/**
+ * Pick the k highest-scoring items, best first
+ *
+ * Keeps a size-k min-heap instead of sorting everything, so selecting the top
+ * few out of n candidates costs O(n log k) comparisons rather than O(n log n).
+ * The score callback runs exactly once per item. Equal scores keep their input
+ * order, exactly like a stable sort followed by slice(0, k).
+ *
+ * @example
+ * selectTopK([{ s: 0.2 }, { s: 0.9 }, { s: 0.5 }], 2, x => x.s); // [{ s: 0.9 }, { s: 0.5 }]
+ */
+export function selectTopK<T>(items: Iterable<T>, k: number, score: (item: T) => number): T[] {
+  if (k <= 0) return [];
+
+  // heap[0] is the weakest of the current top-k; on equal scores the later
+  // input (higher index) is the weaker one
+  const heap: Array<{ item: T; score: number; index: number }> = [];
+  const weaker = (a: { score: number; index: number }, b: { score: number; index: number }): boolean =>
+    a.score < b.score || (a.score === b.score && a.index > b.index);
+
+  const siftDown = (i: number): void => {
+    const n = heap.length;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let smallest = i;
+      if (left < n && weaker(heap[left], heap[smallest])) smallest = left;
+      if (right < n && weaker(heap[right], heap[smallest])) smallest = right;
+      if (smallest === i) return;
+      [heap[i], heap[smallest]] = [heap[smallest], heap[i]];
+      i = smallest;
+    }
+  };
+
+  let index = 0;
+  for (const item of items) {
+    const s = score(item);
+    if (heap.length < k) {
+      heap.push({ item, score: s, index });
+      // Sift up
+      let i = heap.length - 1;
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (!weaker(heap[i], heap[parent])) break;
+        [heap[i], heap[parent]] = [heap[parent], heap[i]];
+        i = parent;
+      }
+    } else if (s > heap[0].score) {
+      // A tie never displaces the root: the new item comes later in the input
+      heap[0] = { item, score: s, index };
+      siftDown(0);
+    }
+    index++;
+  }
+
+  return heap
+    .sort((a, b) => b.score - a.score || a.index - b.index)
+    .map(entry => entry.item);
+}